@@ -87,6 +87,11 @@ class AbstractSeriesAggregator(ABC):
 
         return med_diff, s_idx_diff
 
+    def _has_gaps(self, s: pd.Series) -> bool:
+        # Whether `_insert_gap_none` would insert None values in the (raw) series
+        med_diff, s_idx_diff = self._calc_med_diff(s)
+        return med_diff is not None and bool(np.any(s_idx_diff > 3 * med_diff))
+
     def _insert_gap_none(self, s: pd.Series) -> pd.Series:
         # ------- INSERT None between gaps / irregularly sampled data -------
         med_diff, s_idx_diff = self._calc_med_diff(s)
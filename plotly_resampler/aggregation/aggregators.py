@@ -17,13 +17,18 @@ import pandas as pd
 from ..aggregation.aggregation_interface import AbstractSeriesAggregator
 
 try:
-    # The efficient c version of the LTTB algorithm
-    from .algorithms.lttb_c import LTTB_core_c as LTTB_core
+    # The (SIMD-accelerated) tsdownsample version of the LTTB algorithm, which is
+    # used when the (optional) tsdownsample package is installed
+    from .algorithms.lttb_tsds import LTTB_core_tsds as LTTB_core
 except (ImportError, ModuleNotFoundError):
-    import warnings
+    try:
+        # The efficient c version of the LTTB algorithm
+        from .algorithms.lttb_c import LTTB_core_c as LTTB_core
+    except (ImportError, ModuleNotFoundError):
+        import warnings
 
-    warnings.warn("Could not import lttbc; will use a (slower) python alternative.")
-    from .algorithms.lttb_py import LTTB_core_py as LTTB_core
+        warnings.warn("Could not import lttbc; will use a (slower) python alternative.")
+        from .algorithms.lttb_py import LTTB_core_py as LTTB_core
 
 
 class LTTB(AbstractSeriesAggregator):
@@ -323,7 +328,8 @@ class EveryNthPoint(AbstractSeriesAggregator):
         super().__init__(interleave_gaps, nan_position, dtype_regex_list=None)
 
     def _aggregate(self, s: pd.Series, n_out: int) -> pd.Series:
-        return s[:: max(1, math.ceil(len(s) / n_out))]
+        # Note: a positional (strided) slice returns a view of the series its data
+        return s.iloc[:: max(1, math.ceil(len(s) / n_out))]
 
 
 class FuncAggregator(AbstractSeriesAggregator):
@@ -68,14 +68,22 @@ class LTTB_core_py:
         if y.dtype == np.bool_:
             y = y.astype(np.int8)
 
+        # Compute the mean of all buckets in a single vectorized pass (instead of a
+        # mean call per bucket in the loop below)
+        bucket_sizes = np.diff(offset)
+        x_means = np.add.reduceat(x[: offset[-1]], offset[:-1], dtype=np.float64)
+        x_means /= bucket_sizes
+        y_means = np.add.reduceat(y[: offset[-1]], offset[:-1], dtype=np.float64)
+        y_means /= bucket_sizes
+
         a = 0
         for i in range(n_out - 3):
             a = (
                 LTTB_core_py._argmax_area(
                     prev_x=x[a],
                     prev_y=y[a],
-                    avg_next_x=np.mean(x[offset[i + 1] : offset[i + 2]]),
-                    avg_next_y=y[offset[i + 1] : offset[i + 2]].mean(),
+                    avg_next_x=x_means[i + 1],
+                    avg_next_y=y_means[i + 1],
                     x_bucket=x[offset[i] : offset[i + 1]],
                     y_bucket=y[offset[i] : offset[i + 1]],
                 )
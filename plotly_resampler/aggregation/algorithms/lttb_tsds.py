@@ -0,0 +1,36 @@
+"""Interface to the (SIMD-accelerated) tsdownsample LTTB implementation."""
+
+
+import numpy as np
+from tsdownsample import LTTBDownsampler
+
+_lttb_downsampler = LTTBDownsampler()
+
+
+class LTTB_core_tsds:
+    @staticmethod
+    def downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """Downsample the data using the LTTB algorithm (tsdownsample implementation).
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The time series array.
+        y : np.ndarray
+            The value series array.
+        n_out : int
+            The number of output points.
+
+        Returns
+        -------
+        np.ndarray
+            The indexes of the selected datapoints.
+        """
+        if y.dtype == np.bool_:
+            # tsdownsample does not support boolean values
+            y = y.view(np.uint8)
+        # Note: tsdownsample returns uint64 indices, whereas the other cores (and the
+        # aggregators) use int64 indices
+        return _lttb_downsampler.downsample(
+            np.ascontiguousarray(x), np.ascontiguousarray(y), n_out=n_out
+        ).astype(np.int64, copy=False)
@@ -70,6 +70,9 @@ static PyObject *downsample_int_double(PyObject *self, PyObject *args)
     long long *sampled_x_data = (long long *)PyArray_DATA(sampled_x);
 
     // The main loop here!
+    // Note: the loop only touches the raw data buffers -> release the GIL so that
+    // other (python) threads can run concurrently
+    Py_BEGIN_ALLOW_THREADS
     Py_ssize_t sampled_index = 0;
     const double every = (double)(data_length - 2) / (n_out - 2);
 
@@ -138,6 +141,7 @@ static PyObject *downsample_int_double(PyObject *self, PyObject *args)
 
     // Always add last! Check for finite values!
     sampled_x_data[sampled_index] = data_length - 1;
+    Py_END_ALLOW_THREADS
 
     // Provide our return value
     PyObject *value = Py_BuildValue("O", sampled_x);
@@ -216,6 +220,9 @@ static PyObject *downsample_double_double(PyObject *self, PyObject *args)
     long long *sampled_x_data = (long long *)PyArray_DATA(sampled_x);
 
     // The main loop here!
+    // Note: the loop only touches the raw data buffers -> release the GIL so that
+    // other (python) threads can run concurrently
+    Py_BEGIN_ALLOW_THREADS
     Py_ssize_t sampled_index = 0;
     const double every = (double)(data_length - 2) / (n_out - 2);
 
@@ -279,6 +286,7 @@ static PyObject *downsample_double_double(PyObject *self, PyObject *args)
 
     // Always add last! Check for finite values!
     sampled_x_data[sampled_index] = data_length - 1;
+    Py_END_ALLOW_THREADS
 
     // Provide our return value
     PyObject *value = Py_BuildValue("O", sampled_x);
@@ -356,6 +364,9 @@ static PyObject *downsample_int_float(PyObject *self, PyObject *args)
     long long *sampled_x_data = (long long *)PyArray_DATA(sampled_x);
 
     // The main loop here!
+    // Note: the loop only touches the raw data buffers -> release the GIL so that
+    // other (python) threads can run concurrently
+    Py_BEGIN_ALLOW_THREADS
     Py_ssize_t sampled_index = 0;
     const double every = (double)(data_length - 2) / (n_out - 2);
 
@@ -419,6 +430,7 @@ static PyObject *downsample_int_float(PyObject *self, PyObject *args)
 
     // Always add last! Check for finite values!
     sampled_x_data[sampled_index] = data_length - 1;
+    Py_END_ALLOW_THREADS
 
     // Provide our return value
     PyObject *value = Py_BuildValue("O", sampled_x);
@@ -496,6 +508,9 @@ static PyObject *downsample_int_int(PyObject *self, PyObject *args)
     long long *sampled_x_data = (long long *)PyArray_DATA(sampled_x);
 
     // The main loop here!
+    // Note: the loop only touches the raw data buffers -> release the GIL so that
+    // other (python) threads can run concurrently
+    Py_BEGIN_ALLOW_THREADS
     Py_ssize_t sampled_index = 0;
     const double every = (double)(data_length - 2) / (n_out - 2);
 
@@ -559,6 +574,7 @@ static PyObject *downsample_int_int(PyObject *self, PyObject *args)
 
     // Always add last! Check for finite values!
     sampled_x_data[sampled_index] = data_length - 1;
+    Py_END_ALLOW_THREADS
 
     // Provide our return value
     PyObject *value = Py_BuildValue("O", sampled_x);
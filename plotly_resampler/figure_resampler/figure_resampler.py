@@ -197,6 +197,7 @@ class FigureResampler(AbstractFigureAggregator, go.Figure):
         convert_traces_kwargs: dict | None = None,
         verbose: bool = False,
         show_dash_kwargs: dict | None = None,
+        resample_cache_size: int = 0,
     ):
         """Initialize a dynamic aggregation data mirror using a dash web app.
 
@@ -241,6 +242,12 @@ class FigureResampler(AbstractFigureAggregator, go.Figure):
         show_dash_kwargs: dict, optional
             A dict that will be used as default kwargs for the :func:`show_dash` method.
             Note that the passed kwargs will be take precedence over these defaults.
+        resample_cache_size: int, optional
+            The maximum number of resampled trace views that are cached, by default 0,
+            i.e., no caching is performed. \n
+            .. attention::
+                Only enable this cache when the hf data is not altered in place, as
+                such adjustments do not invalidate the cached views.
 
         """
         # Parse the figure input before calling `super`
@@ -299,6 +306,7 @@ class FigureResampler(AbstractFigureAggregator, go.Figure):
             show_mean_aggregation_size,
             convert_traces_kwargs,
             verbose,
+            resample_cache_size,
         )
 
         if isinstance(figure, AbstractFigureAggregator):
@@ -12,11 +12,12 @@ from __future__ import annotations
 
 __author__ = "Jonas Van Der Donckt, Jeroen Van Der Donckt, Emiel Deprost"
 
+import numbers
 import re
 from abc import ABC
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from copy import copy
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 import dash
@@ -29,12 +30,29 @@ from ..aggregation import AbstractSeriesAggregator, EfficientLTTB
 from .utils import round_number_str, round_td_str
 
 _hf_data_container = namedtuple("DataContainer", ["x", "y", "text", "hovertext"])
+# The (hf data) trace properties which are not copied to the resampled trace
+_HF_DATA_CONTAINER_FIELDS = frozenset(_hf_data_container._fields)
+
+# The hf_data keys whose values must be unaltered for a cached resample to be valid
+_RESAMPLE_CACHE_KEYS = ("x", "y", "downsampler", "text", "hovertext")
+
+# The (precompiled) regexes which are used to parse the layout (relayout) keys
+_RE_XAXIS = re.compile(r"xaxis\d*")
+_RE_YAXIS = re.compile(r"yaxis\d*")
+_RE_XAXIS_RANGE0 = re.compile(r"xaxis\d*.range\[0]")
+_RE_XAXIS_RANGE1 = re.compile(r"xaxis\d*.range\[1]")
+_RE_XAXIS_AUTORANGE = re.compile(r"xaxis\d*.autorange")
+_RE_XAXIS_SHOWSPIKES = re.compile(r"xaxis\d*.showspikes")
+_RE_XY_AXIS_RANGE = re.compile(r"[xy]axis\d*.range\[\d+]")
 
 
 class AbstractFigureAggregator(BaseFigure, ABC):
     """Abstract interface for data aggregation functionality for plotly figures."""
 
     _high_frequency_traces = ["scatter", "scattergl"]
+    # The trace properties which are used when updating the trace data (i.e., the
+    # properties that are retained in the `_get_current_graph` output)
+    _current_graph_trace_keys = ("uid", "name", "type", "xaxis", "yaxis")
 
     def __init__(
         self,
@@ -49,6 +67,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         show_mean_aggregation_size: bool = True,
         convert_traces_kwargs: dict | None = None,
         verbose: bool = False,
+        resample_cache_size: int = 0,
     ):
         """Instantiate a resampling data mirror.
 
@@ -90,9 +109,24 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                 ``convert_existing_traces`` is set to True.
         verbose: bool, optional
             Whether some verbose messages will be printed or not, by default False.
+        resample_cache_size: int, optional
+            The maximum number of resampled trace views that are cached (and thus
+            reused when e.g. panning back to a previous view), by default 0, i.e.,
+            no caching is performed. \n
+            .. attention::
+                A cached view is only invalidated when the hf data objects are
+                replaced, not when they are adjusted in place. Hence, only enable
+                this cache when the hf data (i.e., the passed ``hf_x``, ``hf_y``,
+                ... arrays, which are shared with figures that wrap this figure)
+                is not altered in place.
 
         """
         self._hf_data: Dict[str, dict] = {}
+        # A (least recently used) cache of the resampled trace views
+        self._resample_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._resample_cache_size = resample_cache_size
+        # Whether the hf_data dicts have been handed out via the `hf_data` property
+        self._hf_data_exposed = False
         self._global_n_shown_samples = default_n_shown_samples
         self._print_verbose = verbose
         self._show_mean_aggregation_size = show_mean_aggregation_size
@@ -118,6 +152,9 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                     setattr(self, k, v)
             delattr(figure, "_pr_props")  # should not be stored anymore
 
+        # Cache the prefix and suffix lengths (used when updating the trace names)
+        self._prefix_len, self._suffix_len = len(self._prefix), len(self._suffix)
+
         if convert_existing_traces:
             # call __init__ with the correct layout and set the `_grid_ref` of the
             # to-be-converted figure
@@ -138,8 +175,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
 
         # A list of al xaxis and yaxis string names
         # e.g., "xaxis", "xaxis2", "xaxis3", .... for _xaxis_list
-        self._xaxis_list = self._re_matches(re.compile("xaxis\d*"), self._layout.keys())
-        self._yaxis_list = self._re_matches(re.compile("yaxis\d*"), self._layout.keys())
+        self._xaxis_list = self._re_matches(_RE_XAXIS, self._layout.keys())
+        self._yaxis_list = self._re_matches(_RE_YAXIS, self._layout.keys())
         # edge case: an empty `go.Figure()` does not yet contain axes keys
         if not len(self._xaxis_list):
             self._xaxis_list = ["xaxis"]
@@ -175,16 +212,20 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         """
         uid = trace["uid"]
         hf_trace_data = self._hf_data.get(uid)
-        if hf_trace_data is None:
-            trace_props = {
-                k: trace[k] for k in set(trace.keys()).difference({"x", "y"})
-            }
+        if hf_trace_data is None and self._print_verbose:
+            trace_props = {k: trace[k] for k in trace.keys() if k not in ("x", "y")}
             self._print(f"[W] trace with {trace_props} not found")
         return hf_trace_data
 
     def _get_current_graph(self) -> dict:
-        """Create an efficient copy of the current graph by omitting the "hovertext",
-        "x", and "y" properties of each trace.
+        """Create an efficient copy of the current graph by only retaining the trace
+        properties that are required to update the (resampled) trace data.
+
+        .. note::
+            Only the updated trace data (i.e., the ``x``, ``y``, ``text``,
+            ``hovertext`` and ``name`` properties) are sent to the front-end (see
+            :func:`construct_update_data`), hence copying the other trace properties
+            (e.g., the marker arrays) is not necessary.
 
         Returns
         -------
@@ -195,12 +236,10 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         --------
         https://github.com/plotly/plotly.py/blob/2e7f322c5ea4096ce6efe3b4b9a34d9647a8be9c/packages/python/plotly/plotly/basedatatypes.py#L3278
         """
+        trace_keys = self._current_graph_trace_keys
         return {
             "data": [
-                {
-                    k: copy(trace[k])
-                    for k in set(trace.keys()).difference({"x", "y", "hovertext"})
-                }
+                {k: copy(trace[k]) for k in trace_keys if k in trace}
                 for trace in self._data
             ],
             "layout": copy(self._layout),
@@ -211,6 +250,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         trace: dict,
         start: Optional[Union[str, float]] = None,
         end: Optional[Union[str, float]] = None,
+        view_positions: Optional[dict] = None,
     ) -> Optional[Union[dict, BaseTraceType]]:
         """Check and update the passed ``trace`` its data properties based on the
         slice range.
@@ -239,6 +279,9 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         end : Union[float, str], optional
             The end index for which we want the resampled data to be updated to,
             by default None
+        view_positions : dict, optional
+            A dict in which the view positions are shared between traces which have
+            the same hf x-data (for the same ``start`` and ``end``), by default None.
 
         Returns
         -------
@@ -255,56 +298,53 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         """
         hf_trace_data = self._query_hf_data(trace)
         if hf_trace_data is not None:
-            axis_type = hf_trace_data["axis_type"]
-            if axis_type == "date":
-                start, end = pd.to_datetime(start), pd.to_datetime(end)
-                hf_series = self._slice_time(
-                    self._to_hf_series(hf_trace_data["x"], hf_trace_data["y"]),
-                    start,
-                    end,
-                )
+            max_n_samples = hf_trace_data["max_n_samples"]
+
+            # Check whether this view has already been resampled; note that the
+            # cached output is only valid when the hf data (and its aggregation
+            # properties) have not been altered. As (in place) adjustments via the
+            # public `hf_data` property cannot be detected, no caching is performed
+            # once that property has been accessed.
+            use_cache = self._resample_cache_size > 0 and not self._hf_data_exposed
+            cache_key = (trace["uid"], start, end, max_n_samples)
+            cache_check = tuple(hf_trace_data.get(k) for k in _RESAMPLE_CACHE_KEYS)
+            cached = self._resample_cache.get(cache_key) if use_cache else None
+            if cached is not None and all(
+                a is b for a, b in zip(cached[0], cache_check)
+            ):
+                self._resample_cache.move_to_end(cache_key)
+                resampled = cached[1]
             else:
-                hf_series = self._to_hf_series(hf_trace_data["x"], hf_trace_data["y"])
-                if len(hf_series) and (start is not None or end is not None):
-                    start = hf_series.index[0] if start is None else start
-                    end = hf_series.index[-1] if end is None else end
-                    if hf_series.index.is_integer():
-                        start = round(start)
-                        end = round(end)
-
-                    # Search the index-positions
-                    start_idx, end_idx = np.searchsorted(hf_series.index, [start, end])
-                    hf_series = hf_series.iloc[start_idx:end_idx]
-
-            # Return an invisible, single-point, trace when the sliced hf_series doesn't
-            # contain any data in the current view
-            if len(hf_series) == 0:
-                trace["x"] = [start]
-                trace["y"] = [None]
-                trace["text"] = ""
-                trace["hovertext"] = ""
+                resampled = self._resample_hf_trace_data(
+                    hf_trace_data, start, end, view_positions
+                )
+                if use_cache:
+                    self._resample_cache[cache_key] = (cache_check, resampled)
+                    if len(self._resample_cache) > self._resample_cache_size:
+                        self._resample_cache.popitem(last=False)  # least recently used
+            n_window, x_res, y_res, text_res, hovertext_res = resampled
+
+            # Store the data in the trace-fields
+            trace["x"], trace["y"] = x_res, y_res
+            trace["text"], trace["hovertext"] = text_res, hovertext_res
+            if n_window == 0:
                 return trace
-
-            # Downsample the data and store it in the trace-fields
-            downsampler: AbstractSeriesAggregator = hf_trace_data["downsampler"]
-            s_res: pd.Series = downsampler.aggregate(
-                hf_series, hf_trace_data["max_n_samples"]
-            )
-            # Also parse the data types to an orjson compatible format
-            # Note this can be removed once orjson supports f16
-            trace["x"] = self._parse_dtype_orjson(s_res.index)
-            trace["y"] = self._parse_dtype_orjson(s_res.values)
             # todo -> first draft & not MP safe
 
             agg_prefix, agg_suffix = ' <i style="color:#fc9944">~', "</i>"
             name: str = trace["name"].split(agg_prefix)[0]
 
-            if len(hf_series) > hf_trace_data["max_n_samples"]:
-                name = ("" if name.startswith(self._prefix) else self._prefix) + name
-                name += self._suffix if not name.endswith(self._suffix) else ""
+            has_prefix = self._prefix_len > 0 and name.startswith(self._prefix)
+            has_suffix = self._suffix_len > 0 and name.endswith(self._suffix)
+
+            if n_window > max_n_samples:
+                if self._prefix_len and not has_prefix:
+                    name = self._prefix + name
+                if self._suffix_len and not has_suffix:
+                    name += self._suffix
                 # Add the mean aggregation bin size to the trace name
                 if self._show_mean_aggregation_size:
-                    agg_mean = np.mean(np.diff(s_res.index.values))
+                    agg_mean = np.mean(np.diff(self._to_array(x_res)))
                     if isinstance(agg_mean, np.timedelta64):
                         agg_mean = round_td_str(pd.Timedelta(agg_mean))
                     else:
@@ -312,36 +352,169 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                     name += f"{agg_prefix}{agg_mean}{agg_suffix}"
             else:
                 # When not resampled: trim prefix and/or suffix if necessary
-                if len(self._prefix) and name.startswith(self._prefix):
-                    name = name[len(self._prefix) :]
-                if len(self._suffix) and trace["name"].endswith(self._suffix):
-                    name = name[: -len(self._suffix)]
+                if has_prefix:
+                    name = name[self._prefix_len :]
+                if has_suffix:
+                    name = name[: -self._suffix_len]
             trace["name"] = name
-
-            # Check if text also needs to be resampled
-            text = hf_trace_data.get("text")
-            if isinstance(text, (np.ndarray, pd.Series)):
-                # TODO -> extra logic is necessary for the detection and processing of
-                # non data-point selection downsamplers
-                trace["text"] = self._to_hf_series(x=hf_trace_data["x"], y=text).loc[
-                    s_res.index
-                ]
-            else:
-                trace["text"] = text
-
-            # Check if hovertext also needs to be resampled
-            hovertext = hf_trace_data.get("hovertext")
-            if isinstance(hovertext, (np.ndarray, pd.Series)):
-                trace["hovertext"] = self._to_hf_series(
-                    x=hf_trace_data["x"], y=hovertext
-                ).loc[s_res.index]
-            else:
-                trace["hovertext"] = hovertext
             return trace
         else:
             self._print("hf_data not found")
             return None
 
+    def _get_view_positions(
+        self,
+        hf_x: np.ndarray | pd.Index,
+        axis_type: str,
+        start: Optional[Union[str, float]] = None,
+        end: Optional[Union[str, float]] = None,
+    ) -> Tuple[Any, int, int]:
+        """Get the (integer) positions of the hf x-data that are within the view.
+
+        Parameters
+        ----------
+        hf_x : np.ndarray | pd.Index
+            The (sorted) hf x-data; a ``pd.DatetimeIndex`` when `axis_type` is "date".
+        axis_type : str
+            The axis type of the trace its x-data.
+        start : Union[float, str], optional
+            The start of the view, by default None.
+        end : Union[float, str], optional
+            The end of the view, by default None.
+
+        Returns
+        -------
+        Tuple[Any, int, int]
+            The (parsed) start of the view, and the start and end position, i.e.,
+            ``hf_x[start_idx:end_idx]`` is the data within the view.
+
+        """
+        start_idx, end_idx = 0, len(hf_x)
+        if axis_type == "date":
+            start, end = self._to_timestamp(start), self._to_timestamp(end)
+            start_idx, end_idx = self._slice_time_positions(hf_x, start, end)
+        elif len(hf_x) and (start is not None or end is not None):
+            start = hf_x[0] if start is None else start
+            end = hf_x[-1] if end is None else end
+            if np.issubdtype(hf_x.dtype, np.integer):
+                start = round(start)
+                end = round(end)
+
+            # Search the index-positions
+            start_idx, end_idx = self._searchsorted(hf_x, [start, end])
+        return start, start_idx, end_idx
+
+    def _resample_hf_trace_data(
+        self,
+        hf_trace_data: dict,
+        start: Optional[Union[str, float]] = None,
+        end: Optional[Union[str, float]] = None,
+        view_positions: Optional[dict] = None,
+    ) -> Tuple[int, Any, Any, Any, Any]:
+        """Resample the ``hf_trace_data`` for the passed (front-end) view.
+
+        Parameters
+        ----------
+        hf_trace_data : dict
+            The hf_data dict of the trace.
+        start : Union[float, str], optional
+            The start index for which we want resampled data to be updated to,
+            by default None,
+        end : Union[float, str], optional
+            The end index for which we want the resampled data to be updated to,
+            by default None
+        view_positions : dict, optional
+            A dict in which the view positions are shared between traces which have
+            the same hf x-data (for the same ``start`` and ``end``), by default None.
+
+        Returns
+        -------
+        Tuple[int, Any, Any, Any, Any]
+            The number of hf data points in the view, and the resampled x, y, text,
+            and hovertext data.
+
+        """
+        # Note: the hf `x` and `y` can be adjusted on the fly via the public
+        # `hf_data` property (e.g., to a pd.Series or a list), hence the conversion
+        # (a pd.Index is retained, as e.g. a RangeIndex requires no materialization)
+        hf_x = hf_trace_data["x"]
+        if not isinstance(hf_x, pd.Index):
+            hf_x = self._to_array(hf_x)
+        hf_y = self._to_array(hf_trace_data["y"])
+
+        # Slice the raw arrays first, so that the hf_series is only
+        # constructed for the data that is within the view
+        # Note: traces (e.g., on the same subplot) often share the same hf x-data,
+        # hence the view positions are shared via the `view_positions` dict
+        axis_type = hf_trace_data["axis_type"]
+        if axis_type == "date" and not isinstance(hf_x, pd.DatetimeIndex):
+            hf_x = pd.DatetimeIndex(hf_x)
+        shared = None
+        if view_positions is not None:
+            shared = view_positions.get((id(hf_trace_data["x"]), axis_type))
+        if shared is not None and shared[0] is hf_trace_data["x"]:
+            start, start_idx, end_idx = shared[1]
+        else:
+            start, start_idx, end_idx = self._get_view_positions(
+                hf_x, axis_type, start, end
+            )
+            if view_positions is not None:
+                view_positions[(id(hf_trace_data["x"]), axis_type)] = (
+                    hf_trace_data["x"],
+                    (start, start_idx, end_idx),
+                )
+        n_window = end_idx - start_idx
+
+        # Return an invisible, single-point, trace when the sliced hf data doesn't
+        # contain any data in the current view
+        if n_window == 0:
+            return n_window, [start], [None], "", ""
+
+        max_n_samples = hf_trace_data["max_n_samples"]
+        downsampler: AbstractSeriesAggregator = hf_trace_data["downsampler"]
+        x_view, y_view = hf_x[start_idx:end_idx], hf_y[start_idx:end_idx]
+        hf_series = self._to_hf_series(x_view, y_view)
+        no_aggregation = False
+        if n_window <= max_n_samples and hf_y.dtype.kind in "biuf":
+            # The data in view does not need to be aggregated; when no gaps need to
+            # be inserted either, the (zero-copy) slices of the hf data are used
+            # directly. Note: this is only equivalent to the `aggregate` output for
+            # numeric y data, as other dtypes (e.g., str) are converted.
+            downsampler._supports_dtype(hf_series)
+            no_aggregation = not (
+                downsampler.interleave_gaps and downsampler._has_gaps(hf_series)
+            )
+        if no_aggregation:
+            x_res, y_res = x_view, y_view
+            text_pos = slice(start_idx, end_idx)
+        else:
+            # Downsample the data in view
+            s_res: pd.Series = downsampler.aggregate(hf_series, max_n_samples)
+            x_res, y_res = s_res.index, s_res.values
+            text_pos = None  # lazily computed, shared by the text & hovertext
+
+        # Check if text and/or hovertext also need to be resampled
+        texts = []
+        for text in (hf_trace_data.get("text"), hf_trace_data.get("hovertext")):
+            if isinstance(text, (np.ndarray, pd.Series)):
+                # TODO -> extra logic is necessary for the detection and processing
+                # of non data-point selection downsamplers
+                if text_pos is None:
+                    text_pos = self._nearest_positions(hf_x, self._to_array(x_res))
+                text = self._to_array(text)[text_pos]
+            texts.append(text)
+        text, hovertext = texts
+
+        # Also parse the data types to an orjson compatible format
+        # Note this can be removed once orjson supports f16
+        return (
+            n_window,
+            self._parse_dtype_orjson(x_res),
+            self._parse_dtype_orjson(y_res),
+            text,
+            hovertext,
+        )
+
     def _check_update_figure_dict(
         self,
         figure: dict,
@@ -389,9 +562,21 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         if updated_trace_indices is None:
             updated_trace_indices = []
 
+        # Whether the traces of a y-axis should be updated only depends on the layout
+        # of that y-axis -> we determine this once per y-axis (instead of per trace)
+        layout = figure["layout"]
+        yaxis_in_filter: Dict[str, bool] = {}
+
+        # Bind the (frequently accessed) attributes to local variables & use a set for
+        # the (O(1)) membership tests
+        already_updated = set(updated_trace_indices)
+        check_update_trace_data = self._check_update_trace_data
+        # The view positions are shared among the traces with the same hf x-data
+        view_positions = {}
+
         for idx, trace in enumerate(figure["data"]):
             # We skip when the trace-idx already has been updated.
-            if idx in updated_trace_indices:
+            if idx in already_updated:
                 continue
 
             if xaxis_filter is not None:
@@ -403,52 +588,69 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                 else:
                     y_axis = "yaxis" + trace.get("yaxis")[1:]
 
-                # Next to the x-anchor, we also fetch the xaxis which matches the
-                # current trace (i.e. if this value is not None, the axis shares the
-                # x-axis with one or more traces).
-                # This is relevant when e.g. fig.update_traces(xaxis='x...') was called.
-                x_anchor_trace = figure["layout"].get(y_axis, {}).get("anchor")
-                if x_anchor_trace is not None:
-                    xaxis_matches = (
-                        figure["layout"]
-                        .get("xaxis" + x_anchor_trace.lstrip("x"), {})
-                        .get("matches")
+                in_filter = yaxis_in_filter.get(y_axis)
+                if in_filter is None:
+                    in_filter = self._yaxis_in_xaxis_filter(
+                        layout, y_axis, xaxis_filter_short
                     )
-                else:
-                    xaxis_matches = figure["layout"].get("xaxis", {}).get("matches")
-
-                # print(
-                #     f"x_anchor: {x_anchor_trace} - xaxis_filter: {xaxis_filter} ",
-                #     f"- xaxis_matches: {xaxis_matches}"
-                # )
-
-                # We skip when:
-                # * the change was made on the first row and the trace its anchor is not
-                #   in [None, 'x'] and the matching (a.k.a. shared) xaxis is not equal
-                #   to the xaxis filter argument.
-                #   -> why None: traces without row/col argument and stand on first row
-                #      and do not have the anchor property (hence the DICT.get() method)
-                # * x_axis_filter_short not in [x_anchor or xaxis matches] for
-                #   NON first rows
-                if (
-                    xaxis_filter_short == "x"
-                    and (
-                        x_anchor_trace not in (None, "x")
-                        and xaxis_matches != xaxis_filter_short
-                    )
-                ) or (
-                    xaxis_filter_short != "x"
-                    and (xaxis_filter_short not in (x_anchor_trace, xaxis_matches))
-                ):
+                    yaxis_in_filter[y_axis] = in_filter
+                if not in_filter:
                     continue
 
             # If we managed to find and update the trace, it will return the trace
             # and thus not None.
-            updated_trace = self._check_update_trace_data(trace, start=start, end=stop)
+            updated_trace = check_update_trace_data(
+                trace, start=start, end=stop, view_positions=view_positions
+            )
             if updated_trace is not None:
                 updated_trace_indices.append(idx)
         return updated_trace_indices
 
+    @staticmethod
+    def _yaxis_in_xaxis_filter(
+        layout: dict, y_axis: str, xaxis_filter_short: str
+    ) -> bool:
+        """Check whether the traces of ``y_axis`` are affected by the xaxis filter.
+
+        Parameters
+        ----------
+        layout : dict
+            The figure its layout dict.
+        y_axis : str
+            The y-axis (layout key) of the trace(s), e.g., "yaxis2".
+        xaxis_filter_short : str
+            The short name of the filtered x-axis, e.g., "x2".
+
+        Returns
+        -------
+        bool
+            True if the traces of ``y_axis`` should be updated, False otherwise.
+
+        """
+        # Next to the x-anchor, we also fetch the xaxis which matches the
+        # current trace (i.e. if this value is not None, the axis shares the
+        # x-axis with one or more traces).
+        # This is relevant when e.g. fig.update_traces(xaxis='x...') was called.
+        x_anchor_trace = layout.get(y_axis, {}).get("anchor")
+        if x_anchor_trace is not None:
+            xaxis_matches = layout.get("xaxis" + x_anchor_trace.lstrip("x"), {}).get(
+                "matches"
+            )
+        else:
+            xaxis_matches = layout.get("xaxis", {}).get("matches")
+
+        # We skip when:
+        # * the change was made on the first row and the trace its anchor is not
+        #   in [None, 'x'] and the matching (a.k.a. shared) xaxis is not equal
+        #   to the xaxis filter argument.
+        #   -> why None: traces without row/col argument and stand on first row
+        #      and do not have the anchor property (hence the DICT.get() method)
+        # * x_axis_filter_short not in [x_anchor or xaxis matches] for
+        #   NON first rows
+        if xaxis_filter_short == "x":
+            return x_anchor_trace in (None, "x") or xaxis_matches == xaxis_filter_short
+        return xaxis_filter_short in (x_anchor_trace, xaxis_matches)
+
     @staticmethod
     def _get_figure_class(constr: type) -> type:
         """Get the plotly figure class (constructor) for the given class (constructor).
@@ -502,27 +704,160 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             The sliced **view** of the series.
 
         """
+        start_idx, end_idx = AbstractFigureAggregator._slice_time_positions(
+            hf_series.index, t_start, t_stop
+        )
+        return hf_series.iloc[start_idx:end_idx]
 
-        def to_same_tz(
-            ts: Union[pd.Timestamp, None], reference_tz=hf_series.index.tz
-        ) -> Union[pd.Timestamp, None]:
-            """Adjust `ts` its timezone to the `reference_tz`."""
-            if ts is None:
-                return None
-            elif reference_tz is not None:
-                if ts.tz is not None:
-                    assert ts.tz.zone == reference_tz.zone
-                    return ts
-                else:  # localize -> time remains the same
-                    return ts.tz_localize(reference_tz)
-            elif reference_tz is None and ts.tz is not None:
-                return ts.tz_localize(None)
+    @staticmethod
+    def _to_timestamp(t: Union[str, float, pd.Timestamp, None]) -> pd.Timestamp:
+        """Parse the (front-end) date-axis value ``t`` to a ``pd.Timestamp``.
+
+        .. note::
+            The values of a date axis its (relayout) range are (almost always) time
+            strings; constructing the ``pd.Timestamp`` directly avoids the type
+            inference dispatching of ``pd.to_datetime``.
+
+        .. note::
+            Numeric values (Python and numpy numbers alike) are interpreted as
+            **milliseconds** since the epoch, as this is how plotly.js represents
+            numeric dates. Note that ``pd.to_datetime`` would interpret them as
+            nanoseconds.
+
+        """
+        if t is None or isinstance(t, pd.Timestamp):
+            return t
+        elif isinstance(t, str):
+            return pd.Timestamp(t)
+        elif isinstance(t, numbers.Real) and not isinstance(t, (bool, np.bool_)):
+            # plotly.js represents numeric dates as milliseconds since the epoch
+            return pd.Timestamp(t, unit="ms")
+        return pd.to_datetime(t)
+
+    @staticmethod
+    def _to_same_tz(
+        ts: Union[pd.Timestamp, None], reference_tz
+    ) -> Union[pd.Timestamp, None]:
+        """Adjust `ts` its timezone to the `reference_tz`."""
+        if ts is None or ts.tz is reference_tz:
             return ts
+        elif reference_tz is not None:
+            if ts.tz is not None:
+                assert ts.tz.zone == reference_tz.zone
+                return ts
+            else:  # localize -> time remains the same
+                return ts.tz_localize(reference_tz)
+        elif reference_tz is None and ts.tz is not None:
+            return ts.tz_localize(None)
+        return ts
+
+    @staticmethod
+    def _slice_time_positions(
+        index: pd.DatetimeIndex,
+        t_start: Optional[pd.Timestamp] = None,
+        t_stop: Optional[pd.Timestamp] = None,
+    ) -> Tuple[int, int]:
+        """Get the (integer) start & end position of the time-slice of ``index``.
+
+        Parameters
+        ----------
+        index: pd.DatetimeIndex
+            The (sorted) datetime index, for which the slice positions are searched.
+        t_start: pd.Timestamp, optional
+            The lower-time-bound of the slice, if set to None, no lower-bound threshold
+            will be applied, by default None.
+        t_stop:  pd.Timestamp, optional
+            The upper time-bound of the slice, if set to None, no upper-bound threshold
+            will be applied, by default None.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The start and end position, i.e., ``index[start:end]`` is the time-slice.
+
+        """
+
+        def to_datetime64(ts: pd.Timestamp) -> np.datetime64:
+            """Convert `ts` to a (tz-naive, i.e. UTC if tz-aware) datetime64."""
+            return (ts if ts.tz is None else ts.tz_convert(None)).to_datetime64()
 
         if t_start is not None and t_stop is not None:
             assert t_start.tz == t_stop.tz
 
-        return hf_series[to_same_tz(t_start) : to_same_tz(t_stop)]
+        tz = index.tz
+        to_same_tz = AbstractFigureAggregator._to_same_tz
+        t_start, t_stop = to_same_tz(t_start, tz), to_same_tz(t_stop, tz)
+
+        # Note: the `.values` of a (tz-aware) DatetimeIndex are UTC datetime64 values,
+        # searching these is equivalent to (but a lot faster than) label slicing
+        index_values = index.values
+        start_idx, end_idx = 0, len(index_values)
+        if t_start is not None:
+            start_idx = AbstractFigureAggregator._searchsorted(
+                index_values, to_datetime64(t_start), side="left"
+            )
+        if t_stop is not None:
+            end_idx = AbstractFigureAggregator._searchsorted(
+                index_values, to_datetime64(t_stop), side="right"
+            )
+        return start_idx, end_idx
+
+    @staticmethod
+    def _searchsorted(
+        a: Union[np.ndarray, pd.RangeIndex], v: Any, side: str = "left"
+    ) -> Union[int, np.ndarray]:
+        """Perform a `np.searchsorted` for which `v` is cast to the dtype of `a`.
+
+        .. note::
+            Searching with keys of a different dtype than the (sorted) array causes
+            numpy to upcast the whole array, which is a lot slower than the typed path.
+
+        Parameters
+        ----------
+        a : np.ndarray | pd.RangeIndex
+            The sorted array in which the positions are searched.
+        v : Any
+            The value(s) which will be searched for.
+        side : str, optional
+            Passed to ``np.searchsorted``, by default "left".
+
+        Returns
+        -------
+        Union[int, np.ndarray]
+            The insertion indices, with the same shape as `v`.
+
+        """
+        v = np.asarray(v)
+        if isinstance(a, pd.RangeIndex) and a.step > 0 and v.dtype.kind in "iuf":
+            # O(1) positions for a (default) range index, without materializing
+            # (and caching) its values
+            offset = (v - a.start) / a.step
+            pos = np.ceil(offset) if side == "left" else np.floor(offset) + 1
+            pos = np.clip(pos, 0, len(a)).astype(np.int64)
+            return pos if pos.ndim else int(pos)
+        a = np.asarray(a)
+        if a.dtype.kind in "iu" and v.dtype.kind in "iuf":
+            nan = None
+            if v.dtype.kind == "f":
+                # Round the float keys such that the integer keys yield the same
+                # positions, i.e., a[i] >= v <=> a[i] >= ceil(v) for the left side and
+                # a[i] > v <=> a[i] > floor(v) for the right side
+                v = np.ceil(v) if side == "left" else np.floor(v)
+                nan = np.isnan(v)
+                v = np.where(nan, 0, v)
+            # Clip to the dtype its range to avoid over/underflow when casting
+            info = np.iinfo(a.dtype)
+            below, above = v < info.min, v > info.max
+            if nan is not None:
+                above |= nan  # NaN keys are sorted to the end (as in np.searchsorted)
+            pos = np.searchsorted(
+                a, np.clip(v, info.min, info.max).astype(a.dtype), side=side
+            )
+            pos = np.where(below, 0, np.where(above, len(a), pos))
+            return pos if pos.ndim else int(pos)
+        elif a.dtype.kind in "fM" and v.dtype.kind == a.dtype.kind:
+            v = v.astype(a.dtype, copy=False)
+        return np.searchsorted(a, v, side=side)
 
     @property
     def hf_data(self):
@@ -531,6 +866,10 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         .. note::
             The user has full responsibility to adjust ``hf_data`` properly.
 
+        .. note::
+            As the ``hf_data`` might be adjusted (in place) via the returned references,
+            accessing this property clears and disables the cache of resampled trace
+            views (until :func:`reset` is called).
 
         Example:
             >>> fig = FigureResampler(go.Figure())
@@ -549,6 +888,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                 },
             ]
         """
+        self._hf_data_exposed = True
+        self._resample_cache.clear()
         return list(self._hf_data.values())
 
     @staticmethod
@@ -587,6 +928,91 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             dtype="category" if y.dtype.type == np.str_ else y.dtype,
         )
 
+    @staticmethod
+    def _object_to_numeric(a: np.ndarray) -> np.ndarray:
+        """Parse the object array `a` to a numeric array.
+
+        .. note::
+            When the first item is a float, a (C-level) float64 cast is tried first,
+            which is a lot faster than ``pd.to_numeric`` for homogeneous float arrays.
+
+        Raises
+        ------
+        ValueError, TypeError
+            If `a` cannot be parsed to a numeric array.
+
+        """
+        if len(a) and isinstance(a[0], float):
+            try:
+                return a.astype(np.float64)
+            except (ValueError, TypeError):
+                pass  # e.g., None values -> let pandas handle the parsing
+        return pd.to_numeric(a, errors="raise")
+
+    @staticmethod
+    def _to_array(a: np.ndarray | pd.Series | pd.Index) -> np.ndarray:
+        """Return the underlying numpy array of `a` (without copying)."""
+        return a.values if isinstance(a, (pd.Series, pd.Index)) else np.asarray(a)
+
+    @staticmethod
+    def _nearest_positions(x: np.ndarray | pd.Index, x_sel: np.ndarray) -> np.ndarray:
+        """Return, for each value in `x_sel`, the position of the nearest `x` value.
+
+        .. note::
+            This is used to align the (hover)text with the aggregated data; it
+            operates on the underlying (sorted) numpy arrays, which avoids the
+            construction (and label-based lookup) of an intermediate `pd.Series`.
+
+        Parameters
+        ----------
+        x : np.ndarray | pd.Index
+            The sorted hf x-data.
+        x_sel : np.ndarray
+            The x-values (e.g., the aggregated index) whose positions are searched.
+
+        Returns
+        -------
+        np.ndarray
+            The integer positions in `x`, with the same length as `x_sel`.
+        """
+        x = AbstractFigureAggregator._to_array(x)
+        pos = AbstractFigureAggregator._searchsorted(x, x_sel)
+        pos = np.clip(pos, 0, len(x) - 1)
+        left = np.clip(pos - 1, 0, len(x) - 1)
+        if x.dtype.kind in "iub":
+            # avoid (unsigned) integer overflow when computing the distances
+            x, x_sel = x.astype(np.float64), np.asarray(x_sel, dtype=np.float64)
+        take_left = np.abs(x[left] - x_sel) < np.abs(x[pos] - x_sel)
+        return np.where(take_left, left, pos)
+
+    @staticmethod
+    def _is_sorted(x: np.ndarray | pd.Index) -> bool:
+        """Check whether `x` is monotonically increasing.
+
+        .. note::
+            This avoids constructing a `pd.Series` just to access its index its
+            `is_monotonic_increasing` property.
+
+        Parameters
+        ----------
+        x : np.ndarray | pd.Index
+            The hf x-data.
+
+        Returns
+        -------
+        bool
+            True when `x` is monotonically increasing, False otherwise.
+        """
+        if isinstance(x, pd.Index):
+            # O(1) for a RangeIndex & cached for the other index types
+            return x.is_monotonic_increasing
+        x = np.asarray(x)
+        if x.dtype.kind == "M":
+            x = x.view(np.int64)
+        # Note: an element-wise comparison (instead of np.diff) does not overflow
+        # for unsigned integer dtypes
+        return bool(np.all(x[1:] >= x[:-1]))
+
     def _parse_get_trace_props(
         self,
         trace: BaseTraceType,
@@ -685,8 +1111,14 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             # Remove NaNs for efficiency (storing less meaningless data)
             # NaNs introduce gaps between enclosing non-NaN data points & might distort
             # the resampling algorithms
-            if check_nans and pd.isna(hf_y).any():
-                not_nan_mask = ~pd.isna(hf_y)
+            # Note: integer & bool arrays cannot contain NaNs, hence we skip the (full
+            # array) check for these dtypes & we only compute the NaN mask once
+            not_nan_mask = None
+            if check_nans and hf_y.dtype.kind not in "iub":
+                not_nan_mask = ~(
+                    np.isnan(hf_y) if hf_y.dtype.kind in "fc" else pd.isna(hf_y)
+                )
+            if not_nan_mask is not None and not not_nan_mask.all():
                 hf_x = hf_x[not_nan_mask]
                 hf_y = hf_y[not_nan_mask]
                 if isinstance(hf_text, np.ndarray):
@@ -694,17 +1126,17 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                 if isinstance(hf_hovertext, np.ndarray):
                     hf_hovertext = hf_hovertext[not_nan_mask]
 
-            # Try to parse the hf_x data if it is of object type or
-            if len(hf_x) and (hf_x.dtype.type is np.str_ or hf_x.dtype == "object"):
+            # Try to parse the hf_x data if it is of object or (unicode) string type
+            if len(hf_x) and hf_x.dtype.kind in "OU":
                 try:
                     # Try to parse to numeric
-                    hf_x = pd.to_numeric(hf_x, errors="raise")
+                    hf_x = self._object_to_numeric(hf_x)
                 except (ValueError, TypeError):
                     try:
                         # Try to parse to datetime
                         hf_x = pd.to_datetime(hf_x, utc=False, errors="raise")
                         # Will be cast to object array if it contains multiple timezones.
-                        if hf_x.dtype == "object":
+                        if hf_x.dtype.kind == "O":
                             raise ValueError(
                                 "The x-data contains multiple timezones, which is not "
                                 "supported by plotly-resampler!"
@@ -719,13 +1151,13 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             # when y argument is used for the trace constructor instead of hf_y), we
             # transform it to type string as such it will be sent as categorical data
             # to the downsampling algorithm
-            if hf_y.dtype == "object":
+            if hf_y.dtype.kind == "O":
                 # But first, we try to parse to a numeric dtype (as this is the
                 # behavior that plotly supports)
                 # Note that a bool array of type object will remain a bool array (and
                 # not will be transformed to an array of ints (0, 1))
                 try:
-                    hf_y = pd.to_numeric(hf_y, errors="raise")
+                    hf_y = self._object_to_numeric(hf_y)
                 except ValueError:
                     hf_y = hf_y.astype("str")
 
@@ -755,6 +1187,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         downsampler: AbstractSeriesAggregator | None,
         max_n_samples: int | None,
         offset=0,
+        assume_sorted: bool = False,
     ) -> dict:
         """Create the `hf_data` dict which will be put in the `_hf_data` property.
 
@@ -768,19 +1201,17 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             The downsampler which will be used.
         max_n_samples : int | None
             The max number of output samples.
+        assume_sorted : bool, optional
+            Whether the x-data is assumed to be sorted, by default False. If True,
+            the (O(n)) sortedness check of the x-data is skipped.
 
         Returns
         -------
         dict
             The hf_data dict.
         """
-        # We will re-create this each time as hf_x and hf_y withholds
-        # high-frequency data and can be adjusted on the fly with the public hf_data
-        # property.
-        hf_series = self._to_hf_series(x=dc.x, y=dc.y)
-
         # Checking this now avoids less interpretable `KeyError` when resampling
-        assert hf_series.index.is_monotonic_increasing
+        assert assume_sorted or self._is_sorted(dc.x)
 
         # As we support prefix-suffixing of downsampled data, we assure that
         # each trace has a name
@@ -804,14 +1235,29 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             default_downsampler = True
             downsampler = self._global_downsampler
 
+        # Store the hf x & y data as (contiguous) numpy arrays, so that these can be
+        # sliced (as zero-copy views) when updating the trace data.
+        # Note: DatetimeIndex (timezone info) and RangeIndex (constant memory) are
+        # kept as is
+        hf_x = dc.x
+        if isinstance(hf_x, pd.Index) and not isinstance(
+            hf_x, (pd.DatetimeIndex, pd.RangeIndex)
+        ):
+            hf_x = hf_x.values
+        if isinstance(hf_x, np.ndarray) and not hf_x.flags.c_contiguous:
+            hf_x = np.ascontiguousarray(hf_x)
+        hf_y = dc.y
+        if not hf_y.flags.c_contiguous:
+            hf_y = np.ascontiguousarray(hf_y)
+
         # TODO -> can't we just store the DC here (might be less duplication of
         #  code knowledge, because now, you need to know all the eligible hf_keys in
         #  dc
         return {
             "max_n_samples": max_n_samples,
             "default_n_samples": default_n_samples,
-            "x": dc.x,
-            "y": dc.y,
+            "x": hf_x,
+            "y": hf_y,
             "axis_type": axis_type,
             "downsampler": downsampler,
             "default_downsampler": default_downsampler,
@@ -847,6 +1293,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         hf_text: Union[str, Iterable] = None,
         hf_hovertext: Union[str, Iterable] = None,
         check_nans: bool = True,
+        assume_sorted: bool = False,
         **trace_kwargs,
     ):
         """Add a trace to the figure.
@@ -899,6 +1346,13 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             False if you are sure that your data does not contain NaNs (or when the
             downsampler can handle NaNs, e.g., EveryNthPoint). This should considerably
             speed up the graph construction time.
+        assume_sorted: boolean, optional
+            If set to True, the trace's x-data is assumed to be sorted (i.e.,
+            monotonically increasing) and this will not be checked. By default False.
+            As checking this requires a pass over the data, it is recommended to set
+            this parameter to True if you are sure that your x-data is sorted.\n
+            .. warning::
+                Resampling unsorted x-data will result in erroneous output.
         **trace_kwargs: dict
             Additional trace related keyword arguments.
             e.g.: row=.., col=..., secondary_y=...
@@ -965,8 +1419,10 @@ class AbstractFigureAggregator(BaseFigure, ABC):
 
         # First add a UUID, as each (even the non-hf_data traces), must contain this
         # key for comparison. If the trace already has a UUID, we will keep it.
-        uuid_str = str(uuid4()) if trace.uid is None else trace.uid
-        trace.uid = uuid_str
+        # Note: (re-)assigning the uid triggers plotly its property validation
+        if trace.uid is None:
+            trace.uid = str(uuid4())
+        uuid_str = trace.uid
 
         # construct the hf_data_container
         # TODO in future version -> maybe regex on kwargs which start with `hf_`
@@ -988,6 +1444,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                     trace=trace,
                     downsampler=downsampler,
                     max_n_samples=max_n_samples,
+                    assume_sorted=assume_sorted,
                 )
 
                 # Before we update the trace, we create a new pointer to that trace in
@@ -997,7 +1454,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                 # the new trace.
                 trace = trace._props  # convert the trace into a dict
                 trace = {
-                    k: trace[k] for k in set(trace.keys()).difference(set(dc._fields))
+                    k: v for k, v in trace.items() if k not in _HF_DATA_CONTAINER_FIELDS
                 }
 
                 # NOTE:
@@ -1032,6 +1489,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         | AbstractFigureAggregator = None,
         limit_to_views: List[bool] | bool = False,
         check_nans: List[bool] | bool = True,
+        assume_sorted: List[bool] | bool = False,
         **traces_kwargs,
     ):
         """Add traces to the figure.
@@ -1081,6 +1539,11 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             False if the data is known to contain no NaNs (or when the downsampler can
             handle NaNs, e.g., EveryNthPoint). This will considerably speed up the graph
             construction time.
+        assume_sorted : List[bool] | bool, optional
+            List of assume_sorted booleans for the added traces. If set to True, the
+            trace's x-data is assumed to be sorted and this will not be checked. If a
+            single boolean is passed, all to be added traces will use this value,
+            by default False.
 
         **traces_kwargs: dict
             Additional trace related keyword arguments.
@@ -1111,8 +1574,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         # First add a UUID, as each (even the non-hf_data traces), must contain this
         # key for comparison. If the trace already has a UUID, we will keep it.
         for trace in data:
-            uuid_str = str(uuid4()) if trace.uid is None else trace.uid
-            trace.uid = uuid_str
+            if trace.uid is None:
+                trace.uid = str(uuid4())
 
         # Convert the data properties
         if isinstance(max_n_samples, (int, np.integer)) or max_n_samples is None:
@@ -1123,6 +1586,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             limit_to_views = [limit_to_views] * len(data)
         if isinstance(check_nans, bool):
             check_nans = [check_nans] * len(data)
+        if isinstance(assume_sorted, bool):
+            assume_sorted = [assume_sorted] * len(data)
 
         for i, (trace, max_out, downsampler, limit_to_view, check_nan) in enumerate(
             zip(data, max_n_samples, downsamplers, limit_to_views, check_nans)
@@ -1144,11 +1609,14 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                 downsampler=downsampler,
                 max_n_samples=max_out,
                 offset=i,
+                assume_sorted=assume_sorted[i],
             )
 
             # convert the trace into a dict, and only withholds the non-hf props
             trace = trace._props
-            trace = {k: trace[k] for k in set(trace.keys()).difference(set(dc._fields))}
+            trace = {
+                k: v for k, v in trace.items() if k not in _HF_DATA_CONTAINER_FIELDS
+            }
 
             # update the trace data with the HF props
             trace = self._check_update_trace_data(trace)
@@ -1160,6 +1628,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
     def _clear_figure(self):
         """Clear the current figure object it's data and layout."""
         self._hf_data = {}
+        self._resample_cache = OrderedDict()
+        self._hf_data_exposed = False
         self.data = []
         self._data = []
         self._layout = {}
@@ -1168,6 +1638,12 @@ class AbstractFigureAggregator(BaseFigure, ABC):
     def _copy_hf_data(self, hf_data: dict, adjust_default_values: bool = False) -> dict:
         """Copy (i.e. create a new key reference, not a deep copy) of a hf_data dict.
 
+        .. note::
+            The (large) hf arrays are shared by reference and are thus never copied.
+            Re-assigning a key of the copy (e.g., ``hf_data_cp[uid]["x"] = ...``)
+            leaves the original untouched, but in-place modifications of a shared
+            array (e.g., ``hf_data_cp[uid]["x"][0] = ...``) are visible in both.
+
         Parameters
         ----------
         hf_data : dict
@@ -1183,10 +1659,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             The copied (& default values adjusted) output dict.
 
         """
-        hf_data_cp = {
-            uid: {k: hf_dict[k] for k in set(hf_dict.keys())}
-            for uid, hf_dict in hf_data.items()
-        }
+        # Note: a shallow (C-level) dict copy per trace; the (large) arrays are shared
+        hf_data_cp = {uid: hf_dict.copy() for uid, hf_dict in hf_data.items()}
 
         # Adjust the default arguments to the current argument values
         if adjust_default_values:
@@ -1219,6 +1693,19 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             resampled_trace_prefix_suffix=(self._prefix, self._suffix),
         )
 
+    def reset(self):
+        """Remove all traces (and their high-frequency data) from the figure.
+
+        .. note::
+            The figure its layout and its (default) aggregation settings are retained,
+            which makes this cheaper than constructing a new figure object.
+
+        """
+        self._hf_data = {}
+        self._resample_cache = OrderedDict()
+        self._hf_data_exposed = False
+        self.data = []
+
     def construct_update_data(
         self,
         relayout_data: dict,
@@ -1258,8 +1745,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
 
             # ------------------ HF DATA aggregation ---------------------
             # 1. Base case - there is an x-range specified in the front-end
-            start_matches = self._re_matches(re.compile(r"xaxis\d*.range\[0]"), cl_k)
-            stop_matches = self._re_matches(re.compile(r"xaxis\d*.range\[1]"), cl_k)
+            start_matches = self._re_matches(_RE_XAXIS_RANGE0, cl_k, "range[0]")
+            stop_matches = self._re_matches(_RE_XAXIS_RANGE1, cl_k, "range[1]")
             if start_matches and stop_matches:  # when both are not empty
                 for t_start_key, t_stop_key in zip(start_matches, stop_matches):
                     # Check if the xaxis<NUMB> part of xaxis<NUMB>.[0-1] matches
@@ -1275,10 +1762,8 @@ class AbstractFigureAggregator(BaseFigure, ABC):
                     )
 
             # 2. The user clicked on either autorange | reset axes
-            autorange_matches = self._re_matches(
-                re.compile(r"xaxis\d*.autorange"), cl_k
-            )
-            spike_matches = self._re_matches(re.compile(r"xaxis\d*.showspikes"), cl_k)
+            autorange_matches = self._re_matches(_RE_XAXIS_AUTORANGE, cl_k, "autorange")
+            spike_matches = self._re_matches(_RE_XAXIS_SHOWSPIKES, cl_k, "showspikes")
             # 2.1 Reset-axes -> autorange & reset to the global data view
             if autorange_matches and spike_matches:  # when both are not empty
                 for autorange_key in autorange_matches:
@@ -1312,7 +1797,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         extra_layout_updates = {}
 
         # 1.1. Set autorange to False for each layout item with a specified x-range
-        xy_matches = self._re_matches(re.compile(r"[xy]axis\d*.range\[\d+]"), cl_k)
+        xy_matches = self._re_matches(_RE_XY_AXIS_RANGE, cl_k, "]")
         for range_change_axis in xy_matches:
             axis = range_change_axis.split(".")[0]
             extra_layout_updates[f"{axis}.autorange"] = None
@@ -1343,14 +1828,17 @@ class AbstractFigureAggregator(BaseFigure, ABC):
         return series
 
     @staticmethod
-    def _re_matches(regex: re.Pattern, strings: Iterable[str]) -> List[str]:
-        """Returns all the items in ``strings`` which regex.match(es) ``regex``."""
-        matches = []
-        for item in strings:
-            m = regex.match(item)
-            if m is not None:
-                matches.append(m.string)
-        return sorted(matches)
+    def _re_matches(
+        regex: re.Pattern, strings: Iterable[str], endswith: Optional[str] = None
+    ) -> List[str]:
+        """Returns all the items in ``strings`` which regex.match(es) ``regex``.
+
+        If ``endswith`` is passed, only the items which end with this string are
+        matched against the ``regex`` (i.e., a cheap pre-filter).
+        """
+        if endswith is not None:
+            strings = [s for s in strings if s.endswith(endswith)]
+        return sorted(s for s in strings if regex.match(s))
 
     @staticmethod
     def _is_no_update(update_data: Union[List[dict], dash.no_update]) -> bool:
@@ -1374,6 +1862,7 @@ class AbstractFigureAggregator(BaseFigure, ABC):
             "_prefix",
             "_suffix",
             "_global_downsampler",
+            "_resample_cache_size",
         ]
 
     def __reduce__(self):
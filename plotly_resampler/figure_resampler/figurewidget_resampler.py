@@ -51,6 +51,7 @@ class FigureWidgetResampler(
         show_mean_aggregation_size: bool = True,
         convert_traces_kwargs: dict | None = None,
         verbose: bool = False,
+        resample_cache_size: int = 0,
     ):
         # Parse the figure input before calling `super`
         f = self._get_figure_class(go.FigureWidget)()
@@ -96,6 +97,7 @@ class FigureWidgetResampler(
             show_mean_aggregation_size,
             convert_traces_kwargs,
             verbose,
+            resample_cache_size,
         )
 
         if isinstance(figure, AbstractFigureAggregator):
@@ -278,6 +280,8 @@ class FigureWidgetResampler(
         This is useful when adjusting the `hf_data` properties of the
         ``FigureWidgetResampler``.
         """
+        # The hf data might have been adjusted (in place) -> drop the cached views
+        self._resample_cache.clear()
         self._update_spike_ranges(
             self.layout, *[False] * len(self._xaxis_list), force_update=True
         )
@@ -295,6 +299,8 @@ class FigureWidgetResampler(
         This is useful when adjusting the `hf_data` properties of the
         ``FigureWidgetResampler``.
         """
+        # The hf data might have been adjusted (in place) -> drop the cached views
+        self._resample_cache.clear()
         if all(
             self.layout[xaxis].autorange
             or (
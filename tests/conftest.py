@@ -1,8 +1,10 @@
 """Fixtures and helper functions for testing"""
 
 
+import itertools
 import os
-from typing import Union
+import tempfile
+from typing import List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -22,6 +24,27 @@ _nb_samples = 10_000
 data_dir = "examples/data/"
 headless = True
 TESTING_LOCAL = False  # SET THIS TO TRUE IF YOU ARE TESTING LOCALLY
+# The url of a running webdriver service to which the GUI tests attach (if set)
+remote_webdriver_url = os.environ.get("FRS_REMOTE_WEBDRIVER_URL")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "server: test which serves a dash app in a separate process"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # The `server` tests each spawn a dash server process; hence, when running in
+    # parallel with pytest-xdist (`-n auto --dist loadgroup`), they are grouped in a
+    # single worker (which runs them serially) to limit the concurrent processes
+    # Note: tryfirst, as xdist its own hook assigns the groups based on the markers
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("server") is not None:
+            item.add_marker(pytest.mark.xdist_group(name="server"))
 
 
 @pytest.fixture
@@ -32,39 +55,76 @@ def registering_cleanup():
     unregister_plotly_resampler()
 
 
-def _remove_file(file_path):
-    if os.path.exists(file_path):
-        os.remove(file_path)
+@pytest.fixture
+def pickle_figure(tmp_path):
+    # A unique path for each test, so that the (xdist) workers do not share the file
+    return str(tmp_path / "fig.pkl")
 
 
-@pytest.fixture
-def pickle_figure():
-    FIG_PATH = "fig.pkl"
-    _remove_file(FIG_PATH)
-    yield FIG_PATH
-    _remove_file(FIG_PATH)
+# Each (xdist) worker gets its own range of ports for the dash apps of the GUI tests,
+# as these run in parallel under `pytest -n auto` (see the Makefile / CI workflow)
+_worker_idx = int(os.environ.get("PYTEST_XDIST_WORKER", "gw0").replace("gw", "") or 0)
+_dash_ports = itertools.count(9000 + 100 * _worker_idx)
 
 
 @pytest.fixture
-def driver():
-    import time
+def port() -> int:
+    # Note: a fresh port is used for each test, as the port of a terminated dash app
+    # process is not always released immediately
+    return next(_dash_ports)
+
 
+@pytest.fixture(scope="session")
+def session_driver():
+    # Note: launching the browser is the most expensive part of the GUI tests, hence
+    # a single (session-scoped) driver is shared by all tests
     from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
     from seleniumwire import webdriver
     from webdriver_manager.chrome import ChromeDriverManager, ChromeType
 
-    time.sleep(1)
-
     options = Options()
+    # Reuse a (pre-warmed) profile directory, which avoids the first-run
+    # initialization of a fresh (throwaway) profile on each launch.
+    # Note: each (xdist) worker gets its own profile as a profile cannot be shared
+    # between concurrently running browsers
+    profile_dir = os.path.join(
+        tempfile.gettempdir(),
+        "frs_chrome_profile_" + os.environ.get("PYTEST_XDIST_WORKER", "main"),
+    )
+    options.add_argument(f"--user-data-dir={profile_dir}")
+    for arg in [
+        # Reduce the browser its startup & page lifecycle overhead
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+    ]:
+        options.add_argument(arg)
     d = DesiredCapabilities.CHROME
     d["goog:loggingPrefs"] = {"browser": "ALL"}
-    if not TESTING_LOCAL:
+    if remote_webdriver_url:
+        # Attach to an already running (long-lived) driver service, e.g.,
+        # `chromedriver --port=4444`, which avoids the driver (service) launch
+        if headless:
+            options.add_argument("--headless=new")
+        driver = webdriver.Remote(
+            command_executor=remote_webdriver_url,
+            options=options,
+            desired_capabilities=d,
+        )
+    elif not TESTING_LOCAL:
         if headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
         # options.add_argument("--no=sandbox")
         driver = webdriver.Chrome(
-            ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install(),
+            service=Service(
+                ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install()
+            ),
             options=options,
             desired_capabilities=d,
         )
@@ -76,7 +136,71 @@ def driver():
             desired_capabilities=d,
         )
         # driver = webdriver.Firefox(executable_path='/home/jonas/git/gIDLaB/plotly-dynamic-resampling/geckodriver')
-    return driver
+    # Only the explicit (condition-based) waits are used; a non-zero implicit wait
+    # would be added to each failed element lookup of these waits' polls
+    driver.implicitly_wait(0)
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def driver(session_driver):
+    yield session_driver
+
+    # Restore a clean browser state for the next test
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        session_driver.execute_script("window.localStorage.clear();")
+    except WebDriverException:
+        pass  # e.g., the page was not loaded (or has no local storage)
+    session_driver.delete_all_cookies()
+    del session_driver.requests  # the captured (selenium-wire) requests
+    session_driver.get_log("browser")  # flush the browser log
+    session_driver.get("about:blank")
+
+
+@pytest.fixture(scope="module")
+def base_2x2_fig() -> go.Figure:
+    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
+    # Note: this figure is shared by the tests of a module; it is only used as input
+    # for the plotly-resampler figure constructors (which copy it) & must not be
+    # altered by the tests.
+    return make_subplots(
+        rows=2,
+        cols=2,
+        specs=[[{}, {}], [{"colspan": 2}, None]],
+    )
+
+
+@pytest.fixture(scope="session")
+def xy_100k() -> Tuple[np.ndarray, np.ndarray]:
+    # Note: the arrays are shared over all tests, hence they are made read-only
+    x = np.arange(100_000)
+    y = np.sin(x)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+@pytest.fixture(scope="module")
+def tz_series_3d() -> List[pd.Series]:
+    # 3 days of secondly sampled data, represented in multiple time zones
+    # Note: the series are shared by the tests of a module; they must not be altered
+    n = 60 * 60 * 24 * 3
+    dr = pd.Series(
+        index=pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC"),
+        data=np.random.default_rng(42).standard_normal(n),
+    )
+    dr_naive = dr.tz_localize(None)
+    return [
+        dr,
+        dr_naive,
+        dr_naive.tz_localize("Europe/Amsterdam"),
+        dr.tz_convert("Europe/Brussels"),
+        dr.tz_convert("Australia/Perth"),
+        dr.tz_convert("Australia/Canberra"),
+    ]
 
 
 @pytest.fixture
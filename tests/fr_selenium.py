@@ -12,9 +12,14 @@ from __future__ import annotations
 __author__ = "Jonas Van Der Donckt, Jeroen Van Der Donckt"
 
 import json
+import re
 import time
-from typing import List, Union
+from typing import List, Tuple, Union
 
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -32,6 +37,10 @@ from .utils import not_on_linux
 # https://www.blazemeter.com/blog/improve-your-selenium-webdriver-tests-with-pytest
 # and create a parameterized driver.get method
 
+# The poll frequency (in seconds) of the (condition-based) waits; a lot tighter than
+# the selenium default of 0.5s
+_POLL_FREQUENCY = 0.05
+
 
 class RequestParser:
     @staticmethod
@@ -153,42 +162,103 @@ class RequestParser:
 class FigureResamplerGUITests:
     """Wrapper for performing figure-resampler GUI."""
 
+    # CSS selector locators, which target the `data-*` attributes directly so that
+    # the matching is performed in the browser
+    _MODEBAR_GROUP = (By.CSS_SELECTOR, ".modebar-group")
+    _BTN_AUTOSCALE = (By.CSS_SELECTOR, '.modebar-btn[data-title="Autoscale"]')
+    _BTN_RESET_AXES = (By.CSS_SELECTOR, '.modebar-btn[data-title="Reset axes"]')
+
+    @staticmethod
+    def _legend_item_locator(legend_name: str) -> Tuple[str, str]:
+        # Note: json.dumps yields a (double-)quoted & escaped attribute value
+        legend_name = json.dumps(legend_name, ensure_ascii=False)
+        return By.CSS_SELECTOR, f".legendtext[data-unformatted*={legend_name}]"
+
     def __init__(self, driver: webdriver, port: int):
-        """Construct an instance of A firefox selenium driver to fetch wearable data.
+        """Construct the GUI test wrapper for a FigureResampler dash app.
+
+        .. note::
+            Use this class as a context manager, which leaves the page on exit.
 
         Parameters
         ----------
-        username : str
-            The e4connect login username.
-        password : str
-            The e4connect password.
-        save_dir : str
-            The directory in which the data elements will be saved.
-        headless: bool, default: True
-            If set to `True` the driver will be ran in a headless mode.
+        driver : webdriver
+            The (selenium-wire) browser driver that performs the GUI interactions.
+            Its lifecycle is managed by the caller (i.e., the driver fixture).
+        port : int
+            The port on which the dash app of the figure is served.
 
         """
         self.port = port
         self.driver: Union[webdriver.Firefox, webdriver.Chrome] = driver
         self.on_page = False
+        # The modebar presence & the subplot elements are looked up once per page load
+        # (i.e., per `go_to_page` call)
+        self._page_load_counter = 0
+        self._modebar_page_load = None
+        self._subplots = {}
+        self._subplots_page_load = None
+
+    def __enter__(self) -> FigureResamplerGUITests:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Leave the FigureResampler page.
+
+        .. note::
+            The driver itself is not quit, as its lifecycle is managed by the
+            (session-scoped) driver fixture.
+
+        """
+        if self.on_page:
+            self.driver.get("about:blank")
+            self.on_page = False
+
+    def _wait(self, timeout: float = 3) -> WebDriverWait:
+        """Create a `WebDriverWait` which polls with the `_POLL_FREQUENCY`."""
+        return WebDriverWait(self.driver, timeout, poll_frequency=_POLL_FREQUENCY)
 
     def go_to_page(self):
-        """Navigate to FigureResampler page."""
-        time.sleep(1)
-        self.driver.get("http://localhost:{}".format(self.port))
-        self.on_page = True
-        if not_on_linux():
-            time.sleep(7)  # bcs serialization of multiprocessing
+        """Navigate to FigureResampler page & wait until the figure is rendered."""
+        # Note: on windows & mac os, the serialization of the figure (to start the
+        # dash app in a separate process) takes a lot longer
+        timeout = 20 if not_on_linux() else 10
         max_nb_tries = 3
-        for _ in range(max_nb_tries):
+        for i in range(max_nb_tries):
+            self.driver.get("http://localhost:{}".format(self.port))
             try:
-                self.driver.find_element_by_id("resample-figure")
+                self._wait(timeout).until(
+                    lambda d: d.execute_script(
+                        "return document.readyState === 'complete' && !!window.Plotly"
+                        + " && !!document.querySelector("
+                        + "'#resample-figure .js-plotly-plot .main-svg');"
+                    )
+                )
                 break
-            except Exception:
-                time.sleep(5)
+            except TimeoutException:
+                # e.g., the dash app was not yet serving when the page was requested
+                if i == max_nb_tries - 1:
+                    raise
+        self.on_page = True
+        self._page_load_counter += 1
+
+    def clear_requests(self, timeout: float = 3):
+        """Clear the captured requests, once all in-flight requests are answered.
 
-    def clear_requests(self, sleep_time_s=1):
-        time.sleep(sleep_time_s)
+        .. note::
+            This avoids that the (late) responses of previous interactions end up in
+            the requests of a next interaction.
+
+        """
+        try:
+            self._wait(timeout).until(
+                lambda d: all(r.response is not None for r in d.requests)
+            )
+        except TimeoutException:
+            pass  # e.g., a request which never gets a response
         del self.driver.requests
 
     def get_requests(self, delete: bool = True):
@@ -200,7 +270,15 @@ class FigureResamplerGUITests:
 
         return requests
 
-    def drag_and_zoom(self, div_classname, x0=0.25, x1=0.5, y0=0.25, y1=0.5):
+    def drag_and_zoom(
+        self,
+        div_classname,
+        x0=0.25,
+        x1=0.5,
+        y0=0.25,
+        y1=0.5,
+        use_real_mouse: bool = False,
+    ):
         """
         Drags and zooms the div with the given classname.
 
@@ -216,68 +294,154 @@ class FigureResamplerGUITests:
             The relative y-coordinate of the upper left corner of the div.
         y1 : float, default: 0.5
             The relative y-coordinate of the lower right corner of the div.
+        use_real_mouse : bool, default: False
+            If True, the zoom is performed by simulating the mouse drag (i.e., pointer
+            events). Otherwise, the resulting zoom is applied directly via a
+            ``Plotly.relayout`` call, which emits the same relayout keys as a box-zoom
+            drag but avoids the (slow) synthetic mouse motion.
 
         """
         if not self.on_page:
             self.go_to_page()
 
-        WebDriverWait(self.driver, 3).until(
-            EC.presence_of_element_located((By.CLASS_NAME, div_classname))
-        )
-
-        subplot = self.driver.find_element(By.CLASS_NAME, div_classname)
-        size = subplot.size
-        w, h = size["width"], size["height"]
+        subplot = self._get_subplot(div_classname)
+        if not use_real_mouse:
+            try:
+                self._relayout_zoom(subplot, div_classname, x0, x1, y0, y1)
+            except StaleElementReferenceException:
+                # The subplot was redrawn (i.e., replaced) by plotly -> fetch it again
+                subplot = self._get_subplot(div_classname, use_cache=False)
+                self._relayout_zoom(subplot, div_classname, x0, x1, y0, y1)
+            return
+
+        try:
+            w, h = self._arm_relayout_and_get_size(subplot)
+        except StaleElementReferenceException:
+            subplot = self._get_subplot(div_classname, use_cache=False)
+            w, h = self._arm_relayout_and_get_size(subplot)
 
         actions = ActionChains(self.driver)
         actions.move_to_element_with_offset(subplot, xoffset=w * x0, yoffset=h * y0)
         actions.click_and_hold()
-        actions.pause(0.2)
+        actions.pause(0.1)
         actions.move_by_offset(xoffset=w * (x1 - x0), yoffset=h * (y1 - y0))
-        actions.pause(0.2)
         actions.release()
-        actions.pause(0.2)
         actions.perform()
 
-    def _get_modebar_btns(self):
+        # Wait until plotly has processed the drag interaction (i.e., the relayout
+        # event is emitted and the drag-cover, shown while dragging, is removed)
+        self._wait(2).until(
+            lambda d: d.execute_script(
+                "return window._frsRelayout === true"
+                + " && !document.querySelector('.dragcover');"
+            )
+        )
+
+    def _relayout_zoom(self, subplot, div_classname: str, x0, x1, y0, y1):
+        """Apply the box-zoom of ``drag_and_zoom`` via ``Plotly.relayout``.
+
+        .. note::
+            Just as for a box-zoom drag, only the x-range (y-range) is updated when
+            the vertical (horizontal) drag distance is zero.
+
+        """
+        x_idx, y_idx = re.fullmatch(r"x(\d*)y(\d*)", div_classname).groups()
+        self.driver.execute_async_script(
+            """
+            const [el, xName, yName, x0, x1, y0, y1, done] = arguments;
+            const gd = el.closest('.js-plotly-plot');
+            const update = {};
+            const setRange = (axName, f0, f1) => {
+                const ax = gd._fullLayout[axName];
+                const [l0, l1] = ax.range.map((v) => ax.r2l(v));
+                const lo = l0 + (l1 - l0) * Math.min(f0, f1);
+                const hi = l0 + (l1 - l0) * Math.max(f0, f1);
+                update[axName + '.range[0]'] = ax.l2r(lo);
+                update[axName + '.range[1]'] = ax.l2r(hi);
+            };
+            if (x0 !== x1) { setRange(xName, x0, x1); }
+            // Note: the relative y-coordinates are measured from the top
+            if (y0 !== y1) { setRange(yName, 1 - y0, 1 - y1); }
+            Plotly.relayout(gd, update).then(() => done());
+            """,
+            subplot,
+            f"xaxis{x_idx}",
+            f"yaxis{y_idx}",
+            x0,
+            x1,
+            y0,
+            y1,
+        )
+
+    def _get_subplot(self, div_classname: str, use_cache: bool = True):
+        """Get the subplot element, which is cached per page load."""
+        if self._subplots_page_load != self._page_load_counter:
+            self._subplots = {}
+            self._subplots_page_load = self._page_load_counter
+
+        if not use_cache or div_classname not in self._subplots:
+            self._subplots[div_classname] = self._wait().until(
+                EC.presence_of_element_located((By.CLASS_NAME, div_classname))
+            )
+        return self._subplots[div_classname]
+
+    def _arm_relayout_and_get_size(self, subplot) -> Tuple[float, float]:
+        # Fetch the subplot its geometry and (re)arm a `plotly_relayout` listener on
+        # the figure in a single round-trip
+        return self.driver.execute_script(
+            """
+            const gd = arguments[0].closest('.js-plotly-plot');
+            window._frsRelayout = false;
+            if (gd && !gd._frsRelayoutHook) {
+                gd.on('plotly_relayout', () => { window._frsRelayout = true; });
+                gd._frsRelayoutHook = true;
+            }
+            const r = arguments[0].getBoundingClientRect();
+            return [r.width, r.height];
+            """,
+            subplot,
+        )
+
+    def _wait_for_modebar(self):
+        """Wait (once per page load) until the modebar is present."""
         if not self.on_page:
             self.go_to_page()
 
-        WebDriverWait(self.driver, 3).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "modebar-group"))
+        if self._modebar_page_load != self._page_load_counter:
+            self._wait().until(EC.presence_of_element_located(self._MODEBAR_GROUP))
+            self._modebar_page_load = self._page_load_counter
+
+    def _click_modebar_btn(self, locator: Tuple[str, str]) -> bool:
+        """Click the modebar button which matches the given CSS selector ``locator``.
+
+        .. note::
+            The button is looked up (and clicked) in the browser, which requires a
+            single round-trip instead of one per (modebar button) attribute lookup.
+
+        """
+        self._wait_for_modebar()
+        return self.driver.execute_script(
+            """
+            const btn = document.querySelector(arguments[0]);
+            if (btn) { btn.click(); }
+            return btn !== null;
+            """,
+            locator[1],
         )
-        return self.driver.find_elements(By.CLASS_NAME, "modebar-btn")
 
     def autoscale(self):
-        for btn in self._get_modebar_btns():
-            data_title = btn.get_attribute("data-title")
-            if data_title == "Autoscale":
-                ActionChains(self.driver).move_to_element(btn).click().perform()
-                return
+        self._click_modebar_btn(self._BTN_AUTOSCALE)
 
     def reset_axes(self):
-        for btn in self._get_modebar_btns():
-            data_title = btn.get_attribute("data-title")
-            if data_title == "Reset axes":
-                ActionChains(self.driver).move_to_element(btn).click().perform()
-                return
+        self._click_modebar_btn(self._BTN_RESET_AXES)
 
     def click_legend_item(self, legend_name):
-        WebDriverWait(self.driver, 3).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "modebar-group"))
+        self._wait_for_modebar()
+        legend_items = self.driver.find_elements(
+            *self._legend_item_locator(legend_name)
         )
-        for legend_item in self.driver.find_elements(By.CLASS_NAME, "legendtext"):
-            if legend_name in legend_item.get_attribute("data-unformatted"):
-                # move to the center of the item and click it
-                (
-                    ActionChains(self.driver)
-                    .move_to_element(legend_item)
-                    .pause(0.1)
-                    .click()
-                    .perform()
-                )
-                return
-
-    # ------------------------------ DATA MODEL METHODS  ------------------------------
-    def __del__(self):
-        self.driver.close()
+        if legend_items:
+            # Note: plotly its legend toggling listens to (real) mouse down / up
+            # events, hence the item is clicked via an action chain
+            # move to the center of the item and click it
+            ActionChains(self.driver).move_to_element(legend_items[0]).click().perform()
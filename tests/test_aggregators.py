@@ -516,6 +516,7 @@ def test_efficient_lttb_invalid_input_data():
 
 # TODO - also tests for time series, time-series with gaps
 
+
 # ------------------------------- AggregationDownsampler -------------------------------
 def test_func_aggregator_float_time_data(float_series):
     # TIME indexed data -> resampled output should be same size as n_out
@@ -576,6 +577,7 @@ def test_func_aggregator_categorical_sequence_data(cat_series):
     # TIME indexed data -> resampled output should be same size as n_out
     cat_series.index = np.arange(len(cat_series), dtype="uint32")
     cat_series = cat_series[: len(cat_series) // 4]
+
     # note this method takes a long time - so we only test a small number of samples
     def most_common(x):
         return x.value_counts().index.values[0]
@@ -678,3 +680,32 @@ def test_lttb_bindings():
         sampled_x_c = LTTB_core_c.downsample(x_double, y_double, n_out)
         sampled_x_py = LTTB_core_py.downsample(x_double, y_double, n_out)
         assert sum(sampled_x_c == sampled_x_py) / len(sampled_x_c) > 0.995
+
+
+def test_lttb_tsds_bindings():
+    # Test whether the (optional) tsdownsample core produces the same results as the
+    # C core, as it takes precedence when the tsdownsample package is installed
+    pytest.importorskip("tsdownsample")
+    from plotly_resampler.aggregation.algorithms.lttb_tsds import LTTB_core_tsds
+
+    n = np.random.randint(low=1_000_000, high=2_000_000)
+    x_int = np.arange(n, dtype="int64")
+    x_double = x_int.astype("float64")
+    y_double = np.sin(x_int / 300) + np.random.randn(n)
+    y_float = y_double.astype("float32")
+    y_int = (100 * y_double).astype("int64")
+    y_bool = (x_int % 250).astype("bool")
+
+    for n_out in np.random.randint(500, 2000, size=3):
+        for x, y in [
+            (x_int, y_double),
+            (x_int, y_float),
+            (x_int, y_int),
+            (x_int, y_bool),  # viewed as uint8 by the tsdownsample core
+            (x_double, y_double),
+            (x_int[::2], y_double[::2]),  # non-contiguous input
+        ]:
+            sampled_x_c = LTTB_core_c.downsample(x, y, n_out)
+            sampled_x_tsds = LTTB_core_tsds.downsample(x, y, n_out)
+            assert sampled_x_tsds.dtype == sampled_x_c.dtype == np.int64
+            assert np.all(sampled_x_c == sampled_x_tsds)
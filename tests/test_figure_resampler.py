@@ -16,74 +16,64 @@ from plotly.subplots import make_subplots
 from selenium.webdriver.common.by import By
 
 from plotly_resampler import LTTB, EveryNthPoint, FigureResampler
+from plotly_resampler.aggregation import FuncAggregator
 
 # Note: this will be used to skip / alter behavior when running browser tests on
 # non-linux platforms.
-from .utils import not_on_linux
+from .utils import not_on_linux, wait_for_port
 
 
-def test_add_trace_kwarg_space(float_series, bool_series, cat_series):
-    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-
-    kwarg_space_list = [
+@pytest.mark.parametrize(
+    "kwarg_space",
+    [
         {},
         {
             "default_downsampler": LTTB(interleave_gaps=True),
             "resampled_trace_prefix_suffix": tuple(["<b>[r]</b>", "~~"]),
             "verbose": True,
         },
-    ]
-    for kwarg_space in kwarg_space_list:
-        fig = FigureResampler(base_fig, **kwarg_space)
+    ],
+)
+def test_add_trace_kwarg_space(
+    float_series, bool_series, cat_series, base_2x2_fig, kwarg_space
+):
+    fig = FigureResampler(base_2x2_fig, **kwarg_space)
 
-        fig.add_trace(
-            go.Scatter(x=float_series.index, y=float_series),
-            row=1,
-            col=1,
-            limit_to_view=False,
-            hf_text="text",
-            hf_hovertext="hovertext",
-        )
-
-        fig.add_trace(
-            go.Scatter(text="text", name="bool_series"),
-            hf_x=bool_series.index,
-            hf_y=bool_series,
-            row=1,
-            col=2,
-            limit_to_view=True,
-        )
-
-        fig.add_trace(
-            go.Scattergl(text="text", name="cat_series"),
-            row=2,
-            col=1,
-            downsampler=EveryNthPoint(interleave_gaps=True),
-            hf_x=cat_series.index,
-            hf_y=cat_series,
-            limit_to_view=True,
-        )
+    fig.add_trace(
+        go.Scatter(x=float_series.index, y=float_series),
+        row=1,
+        col=1,
+        limit_to_view=False,
+        hf_text="text",
+        hf_hovertext="hovertext",
+    )
 
+    fig.add_trace(
+        go.Scatter(text="text", name="bool_series"),
+        hf_x=bool_series.index,
+        hf_y=bool_series,
+        row=1,
+        col=2,
+        limit_to_view=True,
+    )
 
-def test_add_trace_not_resampling(float_series):
-    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
+    fig.add_trace(
+        go.Scattergl(text="text", name="cat_series"),
+        row=2,
+        col=1,
+        downsampler=EveryNthPoint(interleave_gaps=True),
+        hf_x=cat_series.index,
+        hf_y=cat_series,
+        limit_to_view=True,
     )
 
-    fig = FigureResampler(base_fig, default_n_shown_samples=1000)
+
+def test_add_trace_not_resampling(float_series, base_2x2_fig):
+    vals, idx = float_series.values, float_series.index.values
+    fig = FigureResampler(base_2x2_fig, default_n_shown_samples=1000)
 
     fig.add_trace(
-        go.Scatter(
-            x=float_series.index[:800], y=float_series[:800], name="float_series"
-        ),
+        go.Scatter(x=idx[:800], y=vals[:800], name="float_series"),
         row=1,
         col=1,
         hf_text="text",
@@ -95,8 +85,8 @@ def test_add_trace_not_resampling(float_series):
         limit_to_view=False,
         row=1,
         col=1,
-        hf_x=float_series.index[-800:],
-        hf_y=float_series[-800:],
+        hf_x=idx[-800:],
+        hf_y=vals[-800:],
         hf_text="text",
         hf_hovertext="hovertext",
     )
@@ -173,20 +163,12 @@ def test_add_scatter_trace_no_x():
     fig.add_trace(go.Scatter(name="s2"), hf_y=[2, 1, 4, 3])
 
 
-def test_add_not_a_hf_trace(float_series):
-    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-
-    fig = FigureResampler(base_fig, default_n_shown_samples=1000, verbose=True)
+def test_add_not_a_hf_trace(float_series, base_2x2_fig):
+    vals, idx = float_series.values, float_series.index.values
+    fig = FigureResampler(base_2x2_fig, default_n_shown_samples=1000, verbose=True)
 
     fig.add_trace(
-        go.Scatter(
-            x=float_series.index[:800], y=float_series[:800], name="float_series"
-        ),
+        go.Scatter(x=idx[:800], y=vals[:800], name="float_series"),
         row=1,
         col=1,
         hf_text="text",
@@ -204,14 +186,8 @@ def test_add_not_a_hf_trace(float_series):
     )
 
 
-def test_box_histogram(float_series):
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-
-    fig = FigureResampler(base_fig, default_n_shown_samples=1000, verbose=True)
+def test_box_histogram(float_series, base_2x2_fig):
+    fig = FigureResampler(base_2x2_fig, default_n_shown_samples=1000, verbose=True)
 
     fig.add_trace(
         go.Scattergl(x=float_series.index, y=float_series, name="float_series"),
@@ -221,10 +197,9 @@ def test_box_histogram(float_series):
         hf_hovertext="hovertext",
     )
 
-    fig.add_trace(go.Box(x=float_series.values, name="float_series"), row=1, col=2)
-    fig.add_trace(
-        go.Box(x=float_series.values**2, name="float_series**2"), row=1, col=2
-    )
+    vals = float_series.values
+    fig.add_trace(go.Box(x=vals, name="float_series"), row=1, col=2)
+    fig.add_trace(go.Box(x=np.square(vals), name="float_series**2"), row=1, col=2)
 
     # add a not hf-trace
     fig.add_trace(
@@ -251,26 +226,23 @@ def test_add_traces_from_other_figure():
     )
 
     # First create a pie chart Figure
-    pie_total = go.Figure(data=[go.Pie(labels=labels, values=values)])
+    pie_total = go.Figure(data=[{"type": "pie", "labels": labels, "values": values}])
 
     # Add the pie chart traces to the changes_section figure
     for trace in pie_total.data:
         changes_section.add_trace(trace, row=1, col=1)
 
 
-def test_cat_box_histogram(float_series):
+def test_cat_box_histogram(float_series, base_2x2_fig):
     # Create a categorical series, with mostly a's, but a few sparse b's and c's
-    cats_list = np.array(list("aaaaaaaaaa" * 1000))
-    cats_list[np.random.choice(len(cats_list), 100, replace=False)] = "b"
-    cats_list[np.random.choice(len(cats_list), 50, replace=False)] = "c"
+    cats_list = np.full(10_000, "a", dtype="U1")
+    # Note: `shuffle=False` avoids a permutation of all the (10k) candidate indices
+    rng = np.random.default_rng(0)
+    cats_list[rng.choice(len(cats_list), 100, replace=False, shuffle=False)] = "b"
+    cats_list[rng.choice(len(cats_list), 50, replace=False, shuffle=False)] = "c"
     cat_series = pd.Series(cats_list, dtype="category")
 
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-    fig = FigureResampler(base_fig, default_n_shown_samples=1000, verbose=True)
+    fig = FigureResampler(base_2x2_fig, default_n_shown_samples=1000, verbose=True)
 
     fig.add_trace(
         go.Scattergl(name="cat_series", x=cat_series.index, y=cat_series),
@@ -280,10 +252,9 @@ def test_cat_box_histogram(float_series):
         hf_hovertext="hovertext",
     )
 
-    fig.add_trace(go.Box(x=float_series.values, name="float_box_pow"), row=1, col=2)
-    fig.add_trace(
-        go.Box(x=float_series.values**2, name="float_box_pow_2"), row=1, col=2
-    )
+    vals = float_series.values
+    fig.add_trace(go.Box(x=vals, name="float_box_pow"), row=1, col=2)
+    fig.add_trace(go.Box(x=np.square(vals), name="float_box_pow_2"), row=1, col=2)
 
     # add a not hf-trace
     fig.add_trace(
@@ -298,15 +269,8 @@ def test_cat_box_histogram(float_series):
     fig.update_layout(height=700)
 
 
-def test_replace_figure(float_series):
-    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-
-    fr_fig = FigureResampler(base_fig, default_n_shown_samples=1000)
+def test_replace_figure(float_series, base_2x2_fig):
+    fr_fig = FigureResampler(base_2x2_fig, default_n_shown_samples=1000)
 
     go_fig = go.Figure()
     go_fig.add_trace(go.Scattergl(x=float_series.index, y=float_series, name="fs"))
@@ -327,16 +291,9 @@ def test_replace_figure(float_series):
     assert len(go_fig.data[0]["x"]) == len(float_series)
 
 
-def test_nan_removed_input(float_series):
-    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-
+def test_nan_removed_input(float_series, base_2x2_fig):
     fig = FigureResampler(
-        base_fig,
+        base_2x2_fig,
         default_n_shown_samples=1000,
         resampled_trace_prefix_suffix=(
             '<b style="color:sandybrown">[R]</b>',
@@ -344,8 +301,14 @@ def test_nan_removed_input(float_series):
         ),
     )
 
-    float_series = float_series.copy()
-    float_series.iloc[np.random.choice(len(float_series), 100, replace=False)] = np.nan
+    # Draw the (3 x 100) nan positions at once
+    rng = np.random.default_rng(0)
+    nan_idx = np.split(rng.choice(len(float_series), 300, replace=False), 3)
+
+    # Note: `mask` returns a new series -> no need to copy the fixture data first
+    nan_mask = np.zeros(len(float_series), dtype=bool)
+    nan_mask[nan_idx[0]] = True
+    float_series = float_series.mask(nan_mask)
     fig.add_trace(
         go.Scatter(x=float_series.index, y=float_series, name="float_series"),
         row=1,
@@ -358,7 +321,7 @@ def test_nan_removed_input(float_series):
     assert ~pd.isna(fig.hf_data[0]["y"]).any()
 
     # here we test whether we are able to deal with not-nan output
-    float_series.iloc[np.random.choice(len(float_series), 100)] = np.nan
+    float_series.iloc[nan_idx[1]] = np.nan
     fig.add_trace(
         go.Scatter(
             x=float_series.index, y=float_series
@@ -368,7 +331,7 @@ def test_nan_removed_input(float_series):
         col=1,
     )
 
-    float_series.iloc[np.random.choice(len(float_series), 100)] = np.nan
+    float_series.iloc[nan_idx[2]] = np.nan
     fig.add_trace(
         go.Scattergl(
             x=float_series.index,
@@ -380,16 +343,9 @@ def test_nan_removed_input(float_series):
     )
 
 
-def test_nan_removed_input_check_nans_false(float_series):
-    # see: https://plotly.com/python/subplots/#custom-sized-subplot-with-subplot-titles
-    base_fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[[{}, {}], [{"colspan": 2}, None]],
-    )
-
+def test_nan_removed_input_check_nans_false(float_series, base_2x2_fig):
     fig = FigureResampler(
-        base_fig,
+        base_2x2_fig,
         default_n_shown_samples=1000,
         resampled_trace_prefix_suffix=(
             '<b style="color:sandybrown">[R]</b>',
@@ -397,8 +353,9 @@ def test_nan_removed_input_check_nans_false(float_series):
         ),
     )
 
-    float_series = float_series.copy()
-    float_series.iloc[np.random.choice(len(float_series), 100)] = np.nan
+    nan_mask = np.zeros(len(float_series), dtype=bool)
+    nan_mask[np.random.choice(len(float_series), 100)] = True
+    float_series = float_series.mask(nan_mask)
     fig.add_trace(
         go.Scatter(x=float_series.index, y=float_series, name="float_series"),
         row=1,
@@ -412,135 +369,162 @@ def test_nan_removed_input_check_nans_false(float_series):
     assert pd.isna(fig.hf_data[0]["y"]).any()
 
 
+def test_assume_sorted():
+    x = np.arange(10_000)[::-1]
+    y = np.arange(10_000)
+
+    fig = FigureResampler(
+        default_n_shown_samples=1000,
+        default_downsampler=EveryNthPoint(interleave_gaps=False),
+        show_mean_aggregation_size=False,
+    )
+    # The sortedness check should catch unsorted x-data
+    with pytest.raises(AssertionError):
+        fig.add_trace(go.Scatter(), hf_x=x, hf_y=y)
+    # But it should be skipped when the data is assumed to be sorted
+    fig.add_trace(go.Scatter(), hf_x=x, hf_y=y, assume_sorted=True)
+    fig.add_traces([go.Scatter(x=x, y=y)], assume_sorted=True)
+    assert len(fig.hf_data) == 2
+
+
 def test_hf_text():
     y = np.arange(10_000)
+    ystr = y.astype(str)
 
     fig = FigureResampler()
     fig.add_trace(
-        go.Scatter(name="blabla", text=y.astype(str)),
+        go.Scatter(name="blabla", text=ystr),
         hf_y=y,
     )
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["text"] == ystr)
     assert fig.hf_data[0]["hovertext"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].hovertext is None
 
-    fig = FigureResampler()
-    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_text=y.astype(str))
+    fig.reset()
+    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_text=ystr)
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["text"] == ystr)
     assert fig.hf_data[0]["hovertext"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].hovertext is None
 
 
+def test_reset():
+    x = np.arange(10_000)
+    fig = FigureResampler(default_n_shown_samples=1000)
+    fig.update_layout(title="reset")
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=np.sin(x / 100))
+    fig.add_trace(go.Scatter(name="lf", x=[0, 1], y=[0, 1]))
+
+    fig.reset()
+    assert len(fig.data) == 0
+    assert len(fig.hf_data) == 0
+    # the layout & the aggregation settings are retained
+    assert fig.layout.title.text == "reset"
+    fig.add_trace(go.Scatter(name="cos"), hf_x=x, hf_y=np.cos(x / 100))
+    assert len(fig.hf_data) == 1
+    assert len(fig.data[0]["x"]) == 1000
+
+
 def test_hf_hovertext():
     y = np.arange(10_000)
+    ystr = y.astype(str)
 
     fig = FigureResampler()
     fig.add_trace(
-        go.Scatter(name="blabla", hovertext=y.astype(str)),
+        go.Scatter(name="blabla", hovertext=ystr),
         hf_y=y,
     )
 
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr)
     assert fig.hf_data[0]["text"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].hovertext == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].hovertext == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].text is None
 
-    fig = FigureResampler()
-    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_hovertext=y.astype(str))
+    fig.reset()
+    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_hovertext=ystr)
 
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr)
     assert fig.hf_data[0]["text"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].hovertext == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].hovertext == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].text is None
 
 
 def test_hf_text_and_hf_hovertext():
     y = np.arange(10_000)
+    ystr = y.astype(str)
+    ystr_rev = ystr[::-1]
 
     fig = FigureResampler()
     fig.add_trace(
-        go.Scatter(name="blabla", text=y.astype(str), hovertext=y.astype(str)[::-1]),
+        go.Scatter(name="blabla", text=ystr, hovertext=ystr_rev),
         hf_y=y,
     )
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str)[::-1])
+    assert np.all(fig.hf_data[0]["text"] == ystr)
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr_rev)
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
-    assert np.all(
-        fig.data[0].hovertext == (9_999 - fig.data[0].y).astype(int).astype(str)
-    )
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
+    assert np.all(fig.data[0].hovertext == ystr_rev[fig.data[0].y.astype(int)])
 
-    fig = FigureResampler()
+    fig.reset()
     fig.add_trace(
         go.Scatter(name="blabla"),
         hf_y=y,
-        hf_text=y.astype(str),
-        hf_hovertext=y.astype(str)[::-1],
+        hf_text=ystr,
+        hf_hovertext=ystr_rev,
     )
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str)[::-1])
+    assert np.all(fig.hf_data[0]["text"] == ystr)
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr_rev)
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
-    assert np.all(
-        fig.data[0].hovertext == (9_999 - fig.data[0].y).astype(int).astype(str)
-    )
-
-
-def test_multiple_timezones():
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
+    assert np.all(fig.data[0].hovertext == ystr_rev[fig.data[0].y.astype(int)])
+
+
+@pytest.mark.parametrize(
+    "tz, localize",
+    [
+        ("UTC", False),
+        # same wall times as the UTC range (instead of the same time instants)
+        ("Europe/Amsterdam", True),
+        ("Europe/Brussels", False),
+        ("Australia/Perth", False),
+        ("Australia/Canberra", False),
+    ],
+)
+def test_multiple_timezones(tz, localize):
     n = 5_050
 
-    dr = pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC")
-    dr_v = np.random.randn(n)
-
-    cs = [
-        dr,
-        dr.tz_localize(None).tz_localize("Europe/Amsterdam"),
-        dr.tz_convert("Europe/Brussels"),
-        dr.tz_convert("Australia/Perth"),
-        dr.tz_convert("Australia/Canberra"),
-    ]
+    if localize:
+        date_range = pd.date_range("2022-02-14", freq="s", periods=n, tz=tz)
+    else:
+        dr = pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC")
+        date_range = dr.tz_convert(tz)
+    dr_v = np.random.default_rng(42).standard_normal(n)
+    name = date_range.dtype.name.split(", ")[-1][:-1]
 
-    plain_plotly_fig = make_subplots(rows=len(cs), cols=1, shared_xaxes=True)
-    plain_plotly_fig.update_layout(height=min(300, 250 * len(cs)))
+    plain_plotly_fig = go.Figure()
+    plain_plotly_fig.add_trace(go.Scattergl(x=date_range, y=dr_v, name=name))
 
     fr_fig = FigureResampler(
-        make_subplots(rows=len(cs), cols=1, shared_xaxes=True),
-        default_n_shown_samples=500,
-        convert_existing_traces=False,
-        verbose=True,
+        default_n_shown_samples=500, convert_existing_traces=False, verbose=True
     )
-    fr_fig.update_layout(height=min(300, 250 * len(cs)))
-
-    for i, date_range in enumerate(cs, 1):
-        name = date_range.dtype.name.split(", ")[-1][:-1]
-        plain_plotly_fig.add_trace(
-            go.Scattergl(x=date_range, y=dr_v, name=name), row=i, col=1
-        )
-        fr_fig.add_trace(
-            go.Scattergl(name=name),
-            hf_x=date_range,
-            hf_y=dr_v,
-            row=i,
-            col=1,
-        )
-        # Assert that the time parsing is exactly the same
-        assert plain_plotly_fig.data[0].x[0] == fr_fig.data[0].x[0]
+    fr_fig.add_trace(go.Scattergl(name=name), hf_x=date_range, hf_y=dr_v)
+    # Assert that the time parsing is exactly the same
+    assert plain_plotly_fig.data[0].x[0] == fr_fig.data[0].x[0]
 
 
 def test_multiple_timezones_in_single_x_index__datetimes_and_timestamps():
@@ -731,9 +715,10 @@ def test_hf_x_object_array():
 
 def test_time_tz_slicing():
     n = 5050
+    rng = np.random.default_rng(42)
     dr = pd.Series(
         index=pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC"),
-        data=np.random.randn(n),
+        data=rng.standard_normal(n),
     )
 
     cs = [
@@ -748,32 +733,268 @@ def test_time_tz_slicing():
     fig = FigureResampler(go.Figure())
 
     for s in cs:
-        t_start, t_stop = sorted(s.iloc[np.random.randint(0, n, 2)].index)
+        t_start, t_stop = sorted(s.iloc[rng.integers(0, n, 2)].index)
         out = fig._slice_time(s, t_start, t_stop)
         assert (out.index[0] - t_start) <= pd.Timedelta(seconds=1)
         assert (out.index[-1] - t_stop) <= pd.Timedelta(seconds=1)
+        # the slice should be identical to the (slower) label-based slice
+        assert out.equals(s[t_start:t_stop])
 
 
-def test_time_tz_slicing_different_timestamp():
-    # construct a time indexed series with UTC timezone
-    n = 60 * 60 * 24 * 3
-    dr = pd.Series(
-        index=pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC"),
-        data=np.random.randn(n),
+def test_searchsorted_dtype_cast():
+    fig = FigureResampler(go.Figure())
+
+    x = np.arange(200, dtype=np.uint8)
+    assert list(fig._searchsorted(x, [-5, 300])) == [0, 200]
+    assert list(fig._searchsorted(x, [10.0, 20])) == [10, 20]
+    assert fig._searchsorted(x, 10, side="right") == 11
+    assert fig._searchsorted(np.arange(10, dtype=np.float32), 2.5) == 3
+
+    # non-integral (and NaN) float keys yield the same positions as np.searchsorted
+    x = np.arange(0, 200, 2, dtype=np.int32)
+    v = np.array([-0.5, 9.5, 10.0, 10.5, 11.5, 197.9, 198.5, np.nan])
+    for side in ["left", "right"]:
+        pos = fig._searchsorted(x, v, side=side)
+        assert list(pos) == list(np.searchsorted(x.astype(float), v, side=side))
+        assert fig._searchsorted(x, 10.5, side=side) == 6
+
+
+def test_no_aggregation_when_view_fits_max_n_samples():
+    x = np.arange(10_000)
+    y = np.sin(x / 100)
+
+    fig = FigureResampler(
+        default_n_shown_samples=1000,
+        default_downsampler=EveryNthPoint(interleave_gaps=False),
     )
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    assert len(fig.data[0]["x"]) == 1000
 
-    # create multiple other time zones
-    cs = [
-        dr,
-        dr.tz_localize(None).tz_localize("Europe/Amsterdam"),
-        dr.tz_convert("Europe/Brussels"),
-        dr.tz_convert("Australia/Perth"),
-        dr.tz_convert("Australia/Canberra"),
-    ]
+    # the view contains fewer than max_n_samples points -> raw data is returned
+    trace = fig._check_update_trace_data(fig.data[0].to_plotly_json(), 100, 599)
+    assert np.all(trace["x"] == x[100:599])
+    assert np.all(trace["y"] == y[100:599])
+    assert not trace["name"].startswith(fig._prefix)
+
+    # the default downsampler interleaves gaps, but there are no gaps in this view
+    # -> the raw data is returned as well (without copying it)
+    fig = FigureResampler(default_n_shown_samples=1000)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    trace = fig._check_update_trace_data(fig.data[0].to_plotly_json(), 100, 599)
+    assert np.all(trace["x"] == x[100:599])
+    assert np.all(trace["y"] == y[100:599])
+    assert np.shares_memory(trace["y"], fig.hf_data[0]["y"])
+    assert not trace["name"].startswith(fig._prefix)
+
+    # a view which contains a gap -> a None value is inserted in the gap
+    x_gap = np.concatenate([x[:5_000], x[5_000:] + 10_000])
+    fig = FigureResampler(default_n_shown_samples=1000)
+    fig.add_trace(go.Scatter(name="gap"), hf_x=x_gap, hf_y=y)
+    trace = fig._check_update_trace_data(fig.data[0].to_plotly_json(), 4_800, 15_100)
+    nan_idx = np.flatnonzero(pd.isna(trace["y"]))
+    assert len(nan_idx) == 1 and trace["x"][nan_idx[0]] == 15_000
+    assert len(trace["y"]) == 300 + 1
 
+    # the downsampler its dtype validation is also performed on the raw data
+    fig = FigureResampler(
+        default_n_shown_samples=1000,
+        default_downsampler=FuncAggregator(np.mean, dtype_regex_list=["float"]),
+    )
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    fig.hf_data[0]["y"] = (y * 10).astype(int)
+    with pytest.raises(ValueError):
+        fig._check_update_trace_data(fig.data[0].to_plotly_json(), 100, 599)
+
+    # str y data is handled identically, regardless of the gap interleaving
+    y_str = np.array(list("abcde"))[x % 5]
+    traces = []
+    for downsampler in [EveryNthPoint(interleave_gaps=False), EveryNthPoint()]:
+        fig = FigureResampler(
+            default_n_shown_samples=1000, default_downsampler=downsampler
+        )
+        fig.add_trace(go.Scatter(name="str"), hf_x=x, hf_y=y_str)
+        traces.append(
+            fig._check_update_trace_data(fig.data[0].to_plotly_json(), 100, 599)
+        )
+    for trace in traces:
+        assert isinstance(trace["y"], pd.Categorical)
+        assert np.all(trace["x"] == x[100:599])
+        assert np.all(np.asarray(trace["y"]) == y_str[100:599])
+        assert not trace["name"].startswith(fig._prefix)
+
+
+def test_prefix_suffix_trace_name():
+    x = np.arange(10_000)
+    fig = FigureResampler(
+        default_n_shown_samples=1000,
+        resampled_trace_prefix_suffix=("<b>[R]</b> ", " ~~"),
+        show_mean_aggregation_size=True,
+    )
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=np.sin(x / 100))
+    assert fig.data[0].name.startswith("<b>[R]</b> sin ~~")
+
+    # zoom in so that the data is not aggregated -> prefix & suffix are removed
+    trace = fig._check_update_trace_data(fig.data[0].to_plotly_json(), 100, 599)
+    assert trace["name"] == "sin"
+
+
+def test_resample_cache():
+    x = np.arange(10_000)
+    y = np.sin(x / 100)
+
+    fig = FigureResampler(default_n_shown_samples=1000, resample_cache_size=128)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    trace = fig.data[0].to_plotly_json()
+
+    out1 = dict(fig._check_update_trace_data(dict(trace), 10, 5_000))
+    out2 = dict(fig._check_update_trace_data(dict(trace), 10, 5_000))
+    # the second call is served from the cache
+    assert out1["x"] is out2["x"] and out1["y"] is out2["y"]
+    assert out1["name"] == out2["name"]
+
+    # the cache size is bounded
+    for i in range(fig._resample_cache_size + 10):
+        fig._check_update_trace_data(dict(trace), i, 5_000)
+    assert len(fig._resample_cache) == fig._resample_cache_size
+
+    # adjusting the hf_data invalidates the cached views
+    fig.hf_data[0]["y"] = -y
+    out3 = fig._check_update_trace_data(dict(trace), 10, 5_000)
+    assert np.all(out3["y"] == -out1["y"])
+
+
+def test_resample_cache_disabled_by_default():
+    x = np.arange(10_000)
+    y = np.sin(x / 100)
+    relayout = {"xaxis.range[0]": 10, "xaxis.range[1]": 5_000}
+
+    fig = FigureResampler(default_n_shown_samples=1000)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    fig_cp = FigureResampler(fig)
+    y_out = np.array(fig_cp.construct_update_data(relayout)[1]["y"])
+
+    # in place adjustments of the (shared) hf data are reflected in the output
+    y *= -1
+    assert np.all(fig_cp.construct_update_data(relayout)[1]["y"] == -y_out)
+    fig.hf_data[0]["y"] *= -1
+    assert np.all(fig_cp.construct_update_data(relayout)[1]["y"] == y_out)
+    assert len(fig._resample_cache) == len(fig_cp._resample_cache) == 0
+
+
+def test_hf_data_list_x():
+    n = 10_000
+    x = np.arange(n)
+    fig = FigureResampler(default_n_shown_samples=1000, resample_cache_size=128)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=np.sin(x / 100))
+
+    # the hf x-data can be adjusted to a plain list via the hf_data property
+    fig.hf_data[0]["x"] = list(x + 10)
+    out = fig.construct_update_data({"xaxis.range[0]": 100, "xaxis.range[1]": 5_000})
+    assert len(out[1]["x"]) == 1000
+    assert out[1]["x"][0] == 100 and out[1]["x"][-1] == 4_999
+
+    out = fig.construct_update_data({"xaxis.autorange": True, "xaxis.showspikes": True})
+    assert len(out[1]["x"]) == 1000
+    assert out[1]["x"][0] == 10 and out[1]["x"][-1] == n + 9
+
+
+def test_resample_cache_hf_data_inplace():
+    x = np.arange(10_000)
+    y = np.sin(x / 100)
+
+    fig = FigureResampler(default_n_shown_samples=1000, resample_cache_size=128)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y.copy())
+    relayout = {"xaxis.range[0]": 10, "xaxis.range[1]": 5_000}
+
+    hf_data = fig.hf_data
+    y_out = np.array(fig.construct_update_data(relayout)[1]["y"])
+    # an in place adjustment of the hf_data is reflected in the output
+    hf_data[0]["y"] *= -1
+    assert np.all(fig.construct_update_data(relayout)[1]["y"] == -y_out)
+    assert len(fig._resample_cache) == 0
+
+    # the caching is re-enabled once the figure is reset
+    fig.reset()
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    fig.construct_update_data(relayout)
+    # i.e., the initial (full) view and the relayout view
+    assert len(fig._resample_cache) == 2
+
+
+def test_resample_cache_autorange():
+    x = np.arange(10_000)
+    y = np.sin(x / 100)
+
+    fig = FigureResampler(default_n_shown_samples=1000, resample_cache_size=128)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+
+    # repeated autorange / showspikes relayouts all resample the full view
+    relayout = {"xaxis.autorange": True, "xaxis.showspikes": True}
+    out1 = fig.construct_update_data(relayout)
+    out2 = fig.construct_update_data(relayout)
+    assert len(fig._resample_cache) == 1
+    assert out1[1]["x"] is out2[1]["x"] and out1[1]["y"] is out2[1]["y"]
+
+    # a new figure data (e.g., after reset) does not reuse the cached output
+    fig.reset()
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=-y)
+    out3 = fig.construct_update_data(relayout)
+    assert np.all(out3[1]["y"] == -out1[1]["y"])
+
+
+def test_resample_cache_fr_copy():
+    x = np.arange(10_000)
+    y = np.sin(x / 100)
+    relayout = {"xaxis.range[0]": 10, "xaxis.range[1]": 5_000}
+
+    fig = FigureResampler(default_n_shown_samples=1000, resample_cache_size=128)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=y)
+    fig.construct_update_data(relayout)
+    assert len(fig._resample_cache) == 2
+
+    # the copied figure shares the hf data, but not the cached output, with the
+    # passed figure
+    fig_cp = FigureResampler(fig, resample_cache_size=128)
+    assert fig_cp.data[0].uid == fig.data[0].uid
+    assert len(fig_cp.data[0]["x"]) == 1000
+    assert len(fig_cp._resample_cache) == 1  # i.e., the initial (full) view
+
+    # an in place adjustment via the hf_data of the passed figure is thus reflected
+    y_out = np.array(fig.construct_update_data(relayout)[1]["y"])
+    fig.hf_data[0]["y"] *= -1
+    assert np.all(fig_cp.construct_update_data(relayout)[1]["y"] == -y_out)
+
+
+def test_range_index_view_positions():
+    n = 100_000
+    y = np.sin(np.arange(n) / 100)
+    fig = FigureResampler(default_n_shown_samples=1000)
+    fig.add_trace(go.Scatter(name="range"), hf_y=y)
+    fig.add_trace(go.Scatter(name="arange"), hf_x=np.arange(n), hf_y=y)
+    hf_x = fig.hf_data[0]["x"]
+    assert isinstance(hf_x, pd.RangeIndex)
+
+    for start, end in [(10.3, 50_000), (-20, 999.5), (99_000, 2 * n), (-10, -5)]:
+        out = fig.construct_update_data(
+            {"xaxis.range[0]": start, "xaxis.range[1]": end}
+        )
+        # the range index yields the same view as its materialized counterpart
+        assert np.all(out[1]["x"] == out[2]["x"])
+        assert np.all(out[1]["y"] == out[2]["y"])
+
+    # the positions are computed without materializing the range index its values
+    assert "_values" not in hf_x._cache
+
+
+def test_time_tz_slicing_different_timestamp(tz_series_3d):
+    # the (UTC & other) time zone aware series
+    cs = [s for s in tz_series_3d if s.index.tz is not None]
+    n = len(cs[0])
+
+    rng = np.random.default_rng(42)
     fig = FigureResampler(go.Figure())
     for i, s in enumerate(cs):
-        t_start, t_stop = sorted(s.iloc[np.random.randint(0, n, 2)].index)
+        t_start, t_stop = sorted(s.iloc[rng.integers(0, n, 2)].index)
         t_start = t_start.tz_convert(cs[(i + 1) % len(cs)].index.tz)
         t_stop = t_stop.tz_convert(cs[(i + 1) % len(cs)].index.tz)
 
@@ -783,35 +1004,23 @@ def test_time_tz_slicing_different_timestamp():
             fig._slice_time(s, t_start, t_stop)
 
 
-def test_different_tz_no_tz_series_slicing():
-    n = 60 * 60 * 24 * 3
-    dr = pd.Series(
-        index=pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC"),
-        data=np.random.randn(n),
-    )
-
-    cs = [
-        dr,
-        dr.tz_localize(None),
-        dr.tz_localize(None).tz_localize("Europe/Amsterdam"),
-        dr.tz_convert("Europe/Brussels"),
-        dr.tz_convert("Australia/Perth"),
-        dr.tz_convert("Australia/Canberra"),
-    ]
+def test_different_tz_no_tz_series_slicing(tz_series_3d):
+    cs = tz_series_3d
+    n = len(cs[0])
 
+    rng = np.random.default_rng(42)
     fig = FigureResampler(go.Figure())
 
     for i, s in enumerate(cs):
-        t_start, t_stop = sorted(
-            s.tz_localize(None).iloc[np.random.randint(n / 2, n, 2)].index
-        )
+        s_naive = s.tz_localize(None)
+        t_start, t_stop = sorted(s_naive.iloc[rng.integers(n // 2, n, 2)].index)
         # both timestamps now have the same tz
         t_start = t_start.tz_localize(cs[(i + 1) % len(cs)].index.tz)
         t_stop = t_stop.tz_localize(cs[(i + 1) % len(cs)].index.tz)
 
         # the s has no time-info -> assumption is made that s has the same time-zone
         # the timestamps
-        out = fig._slice_time(s.tz_localize(None), t_start, t_stop)
+        out = fig._slice_time(s_naive, t_start, t_stop)
         assert (out.index[0].tz_localize(t_start.tz) - t_start) <= pd.Timedelta(
             seconds=1
         )
@@ -820,28 +1029,16 @@ def test_different_tz_no_tz_series_slicing():
         )
 
 
-def test_multiple_tz_no_tz_series_slicing():
-    n = 60 * 60 * 24 * 3
-    dr = pd.Series(
-        index=pd.date_range("2022-02-14", freq="s", periods=n, tz="UTC"),
-        data=np.random.randn(n),
-    )
-
-    cs = [
-        dr,
-        dr.tz_localize(None),
-        dr.tz_localize(None).tz_localize("Europe/Amsterdam"),
-        dr.tz_convert("Europe/Brussels"),
-        dr.tz_convert("Australia/Perth"),
-        dr.tz_convert("Australia/Canberra"),
-    ]
+def test_multiple_tz_no_tz_series_slicing(tz_series_3d):
+    cs = tz_series_3d
+    n = len(cs[0])
 
+    rng = np.random.default_rng(42)
     fig = FigureResampler(go.Figure())
 
     for i, s in enumerate(cs):
-        t_start, t_stop = sorted(
-            s.tz_localize(None).iloc[np.random.randint(n / 2, n, 2)].index
-        )
+        s_naive = s.tz_localize(None)
+        t_start, t_stop = sorted(s_naive.iloc[rng.integers(n // 2, n, 2)].index)
         # both timestamps now have the a different tz
         t_start = t_start.tz_localize(cs[(i + 1) % len(cs)].index.tz)
         t_stop = t_stop.tz_localize(cs[(i + 2) % len(cs)].index.tz)
@@ -849,66 +1046,100 @@ def test_multiple_tz_no_tz_series_slicing():
         # Now the assumption cannot be made that s has the same time-zone as the
         # timestamps -> AssertionError will be raised.
         with pytest.raises(AssertionError):
-            fig._slice_time(s.tz_localize(None), t_start, t_stop)
+            fig._slice_time(s_naive, t_start, t_stop)
 
 
-def test_check_update_figure_dict():
+@pytest.mark.parametrize("num_type", [int, float, np.int64, np.float64])
+def test_numeric_date_axis_range(num_type):
+    n = 10_000
+    x = pd.date_range("2020-01-01", periods=n, freq="1s")
+    fig = FigureResampler(default_n_shown_samples=1000)
+    fig.add_trace(go.Scatter(name="sin"), hf_x=x, hf_y=np.sin(np.arange(n) / 100))
+
+    t_start, t_stop = x[1_000], x[1_500]
+    out_str = fig.construct_update_data(
+        {"xaxis.range[0]": str(t_start), "xaxis.range[1]": str(t_stop)}
+    )
+    # plotly.js represents numeric dates as milliseconds since the epoch
+    to_ms = lambda t: num_type(t.value // 1_000_000)  # noqa: E731
+    out_num = fig.construct_update_data(
+        {"xaxis.range[0]": to_ms(t_start), "xaxis.range[1]": to_ms(t_stop)}
+    )
+    assert len(out_num[1]["x"]) == 501  # the end of a date range is inclusive
+    assert np.all(out_num[1]["x"] == out_str[1]["x"])
+    assert fig._to_timestamp(to_ms(t_start)) == t_start
+
+
+def test_check_update_figure_dict(xy_100k):
     # mostly written to test the check_update_figure_dict with
     # "updated_trace_indices" = None
     fr = FigureResampler(go.Figure())
-    n = 100_000
-    x = np.arange(n)
-    y = np.sin(x)
+    x, y = xy_100k
     fr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
     fr._check_update_figure_dict(fr.to_dict())
 
 
-def test_stop_server_inline():
+def test_check_update_figure_dict_shared_x():
+    fr = FigureResampler(go.Figure(), default_n_shown_samples=1000)
+    n = 100_000
+    x = np.arange(n)
+    fr.add_trace(go.Scattergl(name="sin"), hf_x=x, hf_y=np.sin(x / 100))
+    fr.add_trace(go.Scattergl(name="cos"), hf_x=x, hf_y=np.cos(x / 100))
+
+    figure = fr.to_dict()
+    updated = fr._check_update_figure_dict(figure, start=10, stop=20_000)
+    assert updated == [0, 1]
+    for trace in figure["data"]:
+        assert trace["x"][0] >= 10 and trace["x"][-1] <= 20_000
+        assert len(trace["x"]) <= 1000
+
+
+@pytest.mark.server
+def test_stop_server_inline(xy_100k, port):
     # mostly written to test the check_update_figure_dict whether the inline + height
     # line option triggers
     fr = FigureResampler(go.Figure())
-    n = 100_000
-    x = np.arange(n)
-    y = np.sin(x)
+    x, y = xy_100k
     fr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
     fr.update_layout(height=900)
     fr.stop_server()
-    proc = multiprocessing.Process(target=fr.show_dash, kwargs=dict(mode="inline"))
+    proc = multiprocessing.Process(
+        target=fr.show_dash, kwargs=dict(mode="inline", port=port)
+    )
     proc.start()
 
-    time.sleep(3)
+    # wait until the dash server is up, instead of a fixed sleep
+    assert wait_for_port(port)
     fr.stop_server()
     proc.terminate()
 
 
-def test_stop_server_inline_persistent():
+@pytest.mark.server
+def test_stop_server_inline_persistent(xy_100k, port):
     # mostly written to test the check_update_figure_dict whether the inline + height
     # line option triggers
     fr = FigureResampler(go.Figure())
-    n = 100_000
-    x = np.arange(n)
-    y = np.sin(x)
+    x, y = xy_100k
     fr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
     fr.update_layout(height=900)
     fr.stop_server()
     proc = multiprocessing.Process(
-        target=fr.show_dash, kwargs=dict(mode="inline_persistent")
+        target=fr.show_dash, kwargs=dict(mode="inline_persistent", port=port)
     )
     proc.start()
 
-    time.sleep(3)
+    # wait until the dash server is up, instead of a fixed sleep
+    assert wait_for_port(port)
     fr.stop_server()
     proc.terminate()
 
 
-def test_manual_jupyterdashpersistentinline():
+def test_manual_jupyterdashpersistentinline(xy_100k):
     # Manually call the JupyterDashPersistentInline its method
     # This requires some gimmicky stuff to mimmick the behaviour of a jupyter notebook.
 
     fr = FigureResampler(go.Figure())
-    n = 100_000
-    x = np.arange(n)
-    y = np.sin(x)
+    x, y = xy_100k
     fr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
 
     # no need to start the app (we just need the FigureResampler object)
@@ -938,27 +1169,28 @@ def test_manual_jupyterdashpersistentinline():
     app._display_in_jupyter("", port="", mode="external", width="100%", height=500)
 
 
-def test_stop_server_external():
+@pytest.mark.server
+def test_stop_server_external(xy_100k, port):
     fr = FigureResampler(go.Figure())
-    n = 100_000
-    x = np.arange(n)
-    y = np.sin(x)
+    x, y = xy_100k
     fr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
     fr.update_layout(height=900)
     fr.stop_server()
-    proc = multiprocessing.Process(target=fr.show_dash, kwargs=dict(mode="external"))
+    proc = multiprocessing.Process(
+        target=fr.show_dash, kwargs=dict(mode="external", port=port)
+    )
     proc.start()
 
-    time.sleep(3)
+    # wait until the dash server is up, instead of a fixed sleep
+    assert wait_for_port(port)
     fr.stop_server()
     proc.terminate()
 
 
-def test_hf_data_property():
+def test_hf_data_property(xy_100k):
     fr = FigureResampler(go.Figure(), default_n_shown_samples=2_000)
-    n = 100_000
-    x = np.arange(n)
-    y = np.sin(x)
+    x, y = xy_100k
+    n = len(x)
     assert len(fr.hf_data) == 0
     fr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
     assert len(fr.hf_data) == 1
@@ -976,7 +1208,7 @@ def test_fr_add_empty_trace():
 
 
 def test_fr_from_trace_dict():
-    y = np.array([1] * 10_000)
+    y = np.ones(10_000, dtype=np.int64)
     base_fig = {
         "type": "scatter",
         "y": y,
@@ -988,7 +1220,7 @@ def test_fr_from_trace_dict():
     assert len(fr_fig.data) == 1
     assert len(fr_fig.data[0]["x"]) == 1_000
     assert (fr_fig.data[0]["x"][0] >= 0) & (fr_fig.data[0]["x"][-1] < 10_000)
-    assert (fr_fig.data[0]["y"] == [1] * 1_000).all()
+    assert (fr_fig.data[0]["y"] == 1).all()
 
     # assert that all the uuids of data and hf_data match
     # this is a proxy for assuring that the dynamic aggregation should work
@@ -996,7 +1228,7 @@ def test_fr_from_trace_dict():
 
 
 def test_fr_from_figure_dict():
-    y = np.array([1] * 10_000)
+    y = np.ones(10_000, dtype=np.int64)
     base_fig = go.Figure()
     base_fig.add_trace(go.Scatter(y=y))
 
@@ -1006,7 +1238,7 @@ def test_fr_from_figure_dict():
     assert len(fr_fig.data) == 1
     assert len(fr_fig.data[0]["x"]) == 1_000
     assert (fr_fig.data[0]["x"][0] >= 0) & (fr_fig.data[0]["x"][-1] < 10_000)
-    assert (fr_fig.data[0]["y"] == [1] * 1_000).all()
+    assert (fr_fig.data[0]["y"] == 1).all()
 
     # assert that all the uuids of data and hf_data match
     # this is a proxy for assuring that the dynamic aggregation should work
@@ -1064,16 +1296,17 @@ def test_fr_from_list_dict(float_series):
 
 def test_fr_list_dict_add_traces(float_series):
     fr_fig = FigureResampler(default_n_shown_samples=1000)
+    vals = float_series.values
 
     traces: List[dict] = [
-        {"y": float_series.values + 2, "name": "sp2"},
-        {"y": float_series.values, "name": "s"},
+        {"y": vals + 2, "name": "sp2"},
+        {"y": vals, "name": "s"},
     ]
     fr_fig.add_traces(traces)
     # both traces are HF traces so should be aggregated
     assert len(fr_fig.hf_data) == 2
-    assert (fr_fig.hf_data[0]["y"] == float_series + 2).all()
-    assert (fr_fig.hf_data[1]["y"] == float_series).all()
+    assert (fr_fig.hf_data[0]["y"] == vals + 2).all()
+    assert (fr_fig.hf_data[1]["y"] == vals).all()
     assert len(fr_fig.data) == 2
     assert len(fr_fig.data[0]["x"]) == 1_000
     assert (fr_fig.data[0]["x"][0] >= 0) & (fr_fig.data[0]["x"][-1] < 10_000)
@@ -1084,36 +1317,37 @@ def test_fr_list_dict_add_traces(float_series):
     assert fr_fig.data[1].uid in fr_fig._hf_data
 
     # redo the exercise with a new low-freq trace
-    fr_fig.add_traces({"y": float_series[:1000], "name": "s_no_agg"})
+    fr_fig.add_traces({"y": vals[:1000], "name": "s_no_agg"})
     assert len(fr_fig.hf_data) == 2
     assert len(fr_fig.data) == 3
 
     # add low-freq trace but set limit_to_view to True
-    fr_fig.add_traces([{"y": float_series[:100], "name": "s_agg"}], limit_to_views=True)
+    fr_fig.add_traces([{"y": vals[:100], "name": "s_agg"}], limit_to_views=True)
     assert len(fr_fig.hf_data) == 3
     assert len(fr_fig.data) == 4
 
     # add a low-freq trace but adjust max_n_samples
     # note that we use a tuple as input here
-    fr_fig.add_traces(({"y": float_series[:1000], "name": "s_agg"},), max_n_samples=999)
+    fr_fig.add_traces(({"y": vals[:1000], "name": "s_agg"},), max_n_samples=999)
     assert len(fr_fig.hf_data) == 4
     assert len(fr_fig.data) == 5
 
 
 def test_fr_list_dict_add_trace(float_series):
     fr_fig = FigureResampler(default_n_shown_samples=1000)
+    vals = float_series.values
 
     traces: List[dict] = [
-        {"y": float_series.values + 2, "name": "sp2"},
-        {"y": float_series.values, "name": "s"},
+        {"y": vals + 2, "name": "sp2"},
+        {"y": vals, "name": "s"},
     ]
     for trace in traces:
         fr_fig.add_trace(trace)
 
     # both traces are HF traces so should be aggregated
     assert len(fr_fig.hf_data) == 2
-    assert (fr_fig.hf_data[0]["y"] == float_series + 2).all()
-    assert (fr_fig.hf_data[1]["y"] == float_series).all()
+    assert (fr_fig.hf_data[0]["y"] == vals + 2).all()
+    assert (fr_fig.hf_data[1]["y"] == vals).all()
     assert len(fr_fig.data) == 2
     assert len(fr_fig.data[0]["x"]) == 1_000
     assert (fr_fig.data[0]["x"][0] >= 0) & (fr_fig.data[0]["x"][-1] < 10_000)
@@ -1124,17 +1358,17 @@ def test_fr_list_dict_add_trace(float_series):
     assert fr_fig.data[1].uid in fr_fig._hf_data
 
     # redo the exercise with a new low-freq trace
-    fr_fig.add_trace({"y": float_series[:1000], "name": "s_no_agg"})
+    fr_fig.add_trace({"y": vals[:1000], "name": "s_no_agg"})
     assert len(fr_fig.hf_data) == 2
     assert len(fr_fig.data) == 3
 
     # add low-freq trace but set limit_to_view to True
-    fr_fig.add_trace({"y": float_series[:100], "name": "s_agg"}, limit_to_view=True)
+    fr_fig.add_trace({"y": vals[:100], "name": "s_agg"}, limit_to_view=True)
     assert len(fr_fig.hf_data) == 3
     assert len(fr_fig.data) == 4
 
     # add a low-freq trace but adjust max_n_samples
-    lf_series = {"y": float_series[:1000], "name": "s_agg"}
+    lf_series = {"y": vals[:1000], "name": "s_agg"}
     # plotly its default behavior raises a ValueError when a list or tuple is passed
     # to add_trace
     with pytest.raises(ValueError):
@@ -1208,7 +1442,9 @@ def test_fr_copy_hf_data(float_series):
     fr_fig.add_traces(tuple(traces))
 
     hf_data_cp = FigureResampler()._copy_hf_data(fr_fig._hf_data)
-    uid = list(hf_data_cp.keys())[0]
+    uid, uid_1 = list(hf_data_cp.keys())
+    # the hf arrays themselves are shared, not copied
+    assert hf_data_cp[uid_1]["y"] is fr_fig._hf_data[uid_1]["y"]
 
     hf_data_cp[uid]["x"] = np.arange(1000)
     hf_data_cp[uid]["y"] = float_series[:1000]
@@ -1278,7 +1514,7 @@ def test_fr_object_binary_data():
     assert np.all(fig.data[0]["y"] == binary_series)
 
 
-def test_fr_update_layout_axes_range(driver):
+def test_fr_update_layout_axes_range(driver, port):
     nb_datapoints = 2_000
     n_shown = 500  # < nb_datapoints
 
@@ -1339,11 +1575,13 @@ def test_fr_update_layout_axes_range(driver):
         return
 
     f_pr.stop_server()
-    proc = multiprocessing.Process(target=f_pr.show_dash, kwargs=dict(mode="external"))
+    proc = multiprocessing.Process(
+        target=f_pr.show_dash, kwargs=dict(mode="external", port=port)
+    )
     proc.start()
     try:
-        time.sleep(1)
-        driver.get("http://localhost:8050")
+        assert wait_for_port(port)
+        driver.get(f"http://localhost:{port}")
         time.sleep(3)
         # Get the data property from the front-end figure
         el = driver.find_element(by=By.ID, value="resample-figure")
@@ -1366,7 +1604,7 @@ def test_fr_update_layout_axes_range(driver):
         f_pr.stop_server()
 
 
-def test_fr_update_layout_axes_range_no_update(driver):
+def test_fr_update_layout_axes_range_no_update(driver, port):
     nb_datapoints = 2_000
     n_shown = 20_000  # > nb. datapoints
 
@@ -1427,11 +1665,13 @@ def test_fr_update_layout_axes_range_no_update(driver):
         return
 
     f_pr.stop_server()
-    proc = multiprocessing.Process(target=f_pr.show_dash, kwargs=dict(mode="external"))
+    proc = multiprocessing.Process(
+        target=f_pr.show_dash, kwargs=dict(mode="external", port=port)
+    )
     proc.start()
     try:
-        time.sleep(1)
-        driver.get("http://localhost:8050")
+        assert wait_for_port(port)
+        driver.get(f"http://localhost:{port}")
         time.sleep(3)
         # Get the data & layout property from the front-end figure
         el = driver.find_element(by=By.ID, value="resample-figure")
@@ -159,10 +159,9 @@ def test_box_histogram(float_series):
         hf_hovertext="hovertext",
     )
 
-    fig.add_trace(go.Box(x=float_series.values, name="float_series"), row=1, col=2)
-    fig.add_trace(
-        go.Box(x=float_series.values**2, name="float_series**2"), row=1, col=2
-    )
+    vals = float_series.values
+    fig.add_trace(go.Box(x=vals, name="float_series"), row=1, col=2)
+    fig.add_trace(go.Box(x=np.square(vals), name="float_series**2"), row=1, col=2)
 
     # add a not hf-trace
     fig.add_trace(
@@ -177,9 +176,11 @@ def test_box_histogram(float_series):
 
 def test_cat_box_histogram(float_series):
     # Create a categorical series, with mostly a's, but a few sparse b's and c's
-    cats_list = np.array(list("aaaaaaaaaa" * 1000))
-    cats_list[np.random.choice(len(cats_list), 100, replace=False)] = "b"
-    cats_list[np.random.choice(len(cats_list), 50, replace=False)] = "c"
+    cats_list = np.full(10_000, "a", dtype="U1")
+    # Note: `shuffle=False` avoids a permutation of all the (10k) candidate indices
+    rng = np.random.default_rng(0)
+    cats_list[rng.choice(len(cats_list), 100, replace=False, shuffle=False)] = "b"
+    cats_list[rng.choice(len(cats_list), 50, replace=False, shuffle=False)] = "c"
     cat_series = pd.Series(cats_list, dtype="category")
 
     base_fig = make_subplots(
@@ -197,10 +198,9 @@ def test_cat_box_histogram(float_series):
         hf_hovertext="hovertext",
     )
 
-    fig.add_trace(go.Box(x=float_series.values, name="float_box_pow"), row=1, col=2)
-    fig.add_trace(
-        go.Box(x=float_series.values**2, name="float_box_pow_2"), row=1, col=2
-    )
+    vals = float_series.values
+    fig.add_trace(go.Box(x=vals, name="float_box_pow"), row=1, col=2)
+    fig.add_trace(go.Box(x=np.square(vals), name="float_box_pow_2"), row=1, col=2)
 
     # add a not hf-trace
     fig.add_trace(
@@ -331,92 +331,92 @@ def test_nan_removed_input_check_nans_false(float_series):
 
 def test_hf_text():
     y = np.arange(10_000)
+    ystr = y.astype(str)
 
     fig = FigureWidgetResampler()
     fig.add_trace(
-        go.Scatter(name="blabla", text=y.astype(str)),
+        go.Scatter(name="blabla", text=ystr),
         hf_y=y,
     )
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["text"] == ystr)
     assert fig.hf_data[0]["hovertext"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].hovertext is None
 
-    fig = FigureWidgetResampler()
-    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_text=y.astype(str))
+    fig.reset()
+    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_text=ystr)
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["text"] == ystr)
     assert fig.hf_data[0]["hovertext"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].hovertext is None
 
 
 def test_hf_hovertext():
     y = np.arange(10_000)
+    ystr = y.astype(str)
 
     fig = FigureWidgetResampler()
     fig.add_trace(
-        go.Scatter(name="blabla", hovertext=y.astype(str)),
+        go.Scatter(name="blabla", hovertext=ystr),
         hf_y=y,
     )
 
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr)
     assert fig.hf_data[0]["text"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].hovertext == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].hovertext == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].text is None
 
-    fig = FigureWidgetResampler()
-    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_hovertext=y.astype(str))
+    fig.reset()
+    fig.add_trace(go.Scatter(name="blabla"), hf_y=y, hf_hovertext=ystr)
 
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str))
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr)
     assert fig.hf_data[0]["text"] is None
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].hovertext == fig.data[0].y.astype(int).astype(str))
+    assert np.all(fig.data[0].hovertext == ystr[fig.data[0].y.astype(int)])
     assert fig.data[0].text is None
 
 
 def test_hf_text_and_hf_hovertext():
     y = np.arange(10_000)
+    ystr = y.astype(str)
+    ystr_rev = ystr[::-1]
 
     fig = FigureWidgetResampler()
     fig.add_trace(
-        go.Scatter(name="blabla", text=y.astype(str), hovertext=y.astype(str)[::-1]),
+        go.Scatter(name="blabla", text=ystr, hovertext=ystr_rev),
         hf_y=y,
     )
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str)[::-1])
+    assert np.all(fig.hf_data[0]["text"] == ystr)
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr_rev)
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
-    assert np.all(
-        fig.data[0].hovertext == (9_999 - fig.data[0].y).astype(int).astype(str)
-    )
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
+    assert np.all(fig.data[0].hovertext == ystr_rev[fig.data[0].y.astype(int)])
 
-    fig = FigureWidgetResampler()
+    fig.reset()
     fig.add_trace(
         go.Scatter(name="blabla"),
         hf_y=y,
-        hf_text=y.astype(str),
-        hf_hovertext=y.astype(str)[::-1],
+        hf_text=ystr,
+        hf_hovertext=ystr_rev,
     )
 
-    assert np.all(fig.hf_data[0]["text"] == y.astype(str))
-    assert np.all(fig.hf_data[0]["hovertext"] == y.astype(str)[::-1])
+    assert np.all(fig.hf_data[0]["text"] == ystr)
+    assert np.all(fig.hf_data[0]["hovertext"] == ystr_rev)
 
     assert len(fig.data[0].y) < 5_000
-    assert np.all(fig.data[0].text == fig.data[0].y.astype(int).astype(str))
-    assert np.all(
-        fig.data[0].hovertext == (9_999 - fig.data[0].y).astype(int).astype(str)
-    )
+    assert np.all(fig.data[0].text == ystr[fig.data[0].y.astype(int)])
+    assert np.all(fig.data[0].hovertext == ystr_rev[fig.data[0].y.astype(int)])
 
 
 def test_multiple_timezones():
@@ -840,6 +840,28 @@ def test_hf_data_property_reload_data():
     assert (fwr.layout["yaxis"].range[0] == -20) & (fwr.layout["yaxis"].range[-1] == 3)
 
 
+def test_inplace_hf_data_reload_data_reset_axes():
+    fwr = FigureWidgetResampler(go.Figure(), default_n_shown_samples=2_000)
+    n = 100_000
+    x = np.arange(n)
+    y = np.sin(x)
+    fwr.add_trace(go.Scattergl(name="test"), hf_x=x, hf_y=y)
+
+    fwr.layout.update({"xaxis": {"range": [10_000, 20_000]}}, overwrite=False)
+    y_out = np.array(fwr.data[0]["y"])
+
+    # adjust the (hf) data in place, i.e., without the `hf_data` property
+    y *= -2
+    fwr.reload_data()
+    assert np.all(fwr.data[0]["y"] == -2 * y_out)
+
+    fwr.reset_axes()
+    y_out = np.array(fwr.data[0]["y"])
+    y += 5
+    fwr.reset_axes()
+    assert np.all(fwr.data[0]["y"] == y_out + 5)
+
+
 def test_hf_data_property_subplots_reset_axes():
     fwr = FigureWidgetResampler(make_subplots(rows=2, cols=1, shared_xaxes=False))
     n = 100_000
@@ -1753,7 +1775,7 @@ def test_fwr_time_based_data_s():
 
 
 def test_fwr_from_trace_dict():
-    y = np.array([1] * 10_000)
+    y = np.ones(10_000, dtype=np.int64)
     base_fig = {
         "type": "scatter",
         "y": y,
@@ -1765,7 +1787,7 @@ def test_fwr_from_trace_dict():
     assert len(fwr_fig.data) == 1
     assert len(fwr_fig.data[0]["x"]) == 1_000
     assert (fwr_fig.data[0]["x"][0] >= 0) & (fwr_fig.data[0]["x"][-1] < 10_000)
-    assert (fwr_fig.data[0]["y"] == [1] * 1_000).all()
+    assert (fwr_fig.data[0]["y"] == 1).all()
 
     # assert that all the uuids of data and hf_data match
     # this is a proxy for assuring that the dynamic aggregation should work
@@ -1773,7 +1795,7 @@ def test_fwr_from_trace_dict():
 
 
 def test_fwr_from_figure_dict():
-    y = np.array([1] * 10_000)
+    y = np.ones(10_000, dtype=np.int64)
     base_fig = go.Figure()
     base_fig.add_trace(go.Scatter(y=y))
 
@@ -1783,7 +1805,7 @@ def test_fwr_from_figure_dict():
     assert len(fwr_fig.data) == 1
     assert len(fwr_fig.data[0]["x"]) == 1_000
     assert (fwr_fig.data[0]["x"][0] >= 0) & (fwr_fig.data[0]["x"][-1] < 10_000)
-    assert (fwr_fig.data[0]["y"] == [1] * 1_000).all()
+    assert (fwr_fig.data[0]["y"] == 1).all()
 
     # assert that all the uuids of data and hf_data match
     # this is a proxy for assuring that the dynamic aggregation should work
@@ -1,4 +1,6 @@
+import socket
 import sys
+import time
 
 
 def not_on_linux():
@@ -8,3 +10,18 @@ def not_on_linux():
     tricky on other platforms).
     """
     return not sys.platform.startswith("linux")
+
+
+def wait_for_port(port: int, host: str = "127.0.0.1", timeout: float = 5):
+    """Wait until a server accepts connections on the given port.
+
+    Returns True if the port is reachable within ``timeout`` seconds, else False.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False